@@ -4,7 +4,7 @@ PrintOrderWeb - Flask Application Entry Point.
 This is a slim app factory that:
 1. Initializes DLL context (fail-fast, no stub mode)
 2. Starts inventory service (separate thread)
-3. Creates job service (thread-per-job)
+3. Creates job service (bounded job worker pool)
 4. Registers route blueprints
 5. Sets up error handlers and context processors
 
@@ -17,8 +17,8 @@ ARCHITECTURE:
     Inventory Thread (background)
     └── 30-second refresh loop with OWN API client
 
-    Job Threads (one per submission)
-    └── Each with OWN API client, FRESH template
+    Job Worker Threads (bounded pool)
+    └── Each with OWN API client, FRESH template per job
 
 NO SHARED STATE between inventory and job submission.
 Each thread creates its own API client for complete isolation.
@@ -61,38 +61,78 @@ if sys.platform == 'win32':
 import atexit
 import logging
 import os
+import threading
 from pathlib import Path
 
 from dotenv import load_dotenv
-from flask import Flask, session
+from flask import Flask, flash, redirect, request, session
 from werkzeug.exceptions import RequestEntityTooLarge
 
 from logging_config import setup_logging, get_logger
 from core.dll_manager import DLLManager
 from core.exceptions import DLLNotFoundError, ServiceUnavailableError
+from models.inventory import InventoryHealth
 from services.inventory_service import InventoryService
 from services.job_service import JobService
+from services.order_store import OrderStore
 from routes import register_blueprints
-from modules.i18n import create_translation_filter, get_supported_languages, DEFAULT_LANGUAGE
-from modules.printer_config import get_printer_config, update_printer_from_inventory
-from modules.image_defaults import get_default_image
+from modules.i18n import get_translation_filter, get_supported_languages, DEFAULT_LANGUAGE
+from modules.image_defaults import DEFAULT_IMAGES
+from modules.printer_context import UNVERIFIED_PRINTER, with_render_values
 
 
 # Module logger (configured after setup_logging)
 logger = get_logger(__name__)
 
+# Supported languages are fixed at import; set_language validates against the codes
+_SUPPORTED_LANGUAGES = get_supported_languages()
+_SUPPORTED_LANGUAGE_CODES = frozenset(_SUPPORTED_LANGUAGES)
 
-def _get_base_path() -> Path:
+# Sidebar context used while no inventory is available, shared by every
+# fallback render
+_EMPTY_PRINTER_CONTEXT = {
+    "printer": UNVERIFIED_PRINTER,
+    "inventory": {"error": "Unavailable", "toner_balances": {}, "media_options": {}},
+    "toner_details": {},
+    "media_details": {},
+    "unattached_consumables": [],
+    "default_images": DEFAULT_IMAGES
+}
+
+
+# Base path for the application (fixed for the life of the process):
+# In PyInstaller bundle: the directory containing the executable
+# In development: the directory containing app.py
+BASE_PATH = Path(sys.executable).parent if getattr(sys, 'frozen', False) else Path(__file__).parent
+
+
+def _cleanup(app: Flask) -> None:
     """
-    Get the base path for the application.
+    Cleanup on application shutdown.
 
-    In PyInstaller bundle: Returns the directory containing the executable
-    In development: Returns the directory containing app.py
+    Reads the services from app.config rather than closing over them.
+
+    Args:
+        app: Application created by create_app()
     """
-    if getattr(sys, 'frozen', False):
-        return Path(sys.executable).parent
-    else:
-        return Path(__file__).parent
+    logger.info("Shutting down...")
+
+    # Stop inventory service
+    inventory_service = app.config.get("INVENTORY_SERVICE")
+    if inventory_service:
+        inventory_service.stop()
+
+    # Wait for job threads
+    job_service = app.config.get("JOB_SERVICE")
+    if job_service:
+        job_service.shutdown()
+
+    # Close DLL context
+    dll_manager = app.config.get("DLL_MANAGER")
+    if dll_manager:
+        dll_manager.cleanup()
+
+    logger.info("Shutdown complete")
 
 
 def create_app() -> Flask:
@@ -111,8 +151,7 @@ def create_app() -> Flask:
     """
     # Load .env from base path (next to executable in production)
     # Use override=True so .env file always takes precedence over shell environment
-    base_path = _get_base_path()
-    env_file = base_path / '.env'
+    env_file = BASE_PATH / '.env'
     if env_file.exists():
         load_dotenv(env_file, override=True)
     else:
@@ -136,7 +175,7 @@ def create_app() -> Flask:
     app.logger.handlers = root_logger.handlers
     app.logger.setLevel(log_level)
 
-    logger.info(f"Starting PrintOrderWeb in {app.config.get('ENVIRONMENT')} mode")
+    logger.info("Starting PrintOrderWeb in %s mode", app.config.get("ENVIRONMENT"))
 
     # Ensure upload folder exists
     upload_folder = Path(app.config["UPLOAD_FOLDER"])
@@ -154,7 +193,7 @@ def create_app() -> Flask:
         dll_manager.initialize()
         logger.info("DLL context initialized successfully")
     except (DLLNotFoundError, ServiceUnavailableError) as e:
-        logger.error(f"FATAL: Cannot start application - {e}")
+        logger.error("FATAL: Cannot start application - %s", e)
         raise
 
     # Store in app config for access by routes
@@ -172,7 +211,7 @@ def create_app() -> Flask:
         logger.debug("Pre-initializing reverse geocoder...")
         _init_reverse_geocoder()
     except Exception as e:
-        logger.warning(f"Reverse geocoder pre-init failed (non-fatal): {e}")
+        logger.warning("Reverse geocoder pre-init failed (non-fatal): %s", e)
 
     # Create inventory service (starts background thread)
     inventory_service = InventoryService(dll_manager, refresh_interval_seconds=30.0)
@@ -181,10 +220,13 @@ def create_app() -> Flask:
     logger.info("Inventory service started")
 
     # Create job service (manages job threads)
-    job_service = JobService(dll_manager)
+    job_service = JobService(dll_manager, max_workers=app.config.get("JOB_WORKERS") or None)
     app.config["JOB_SERVICE"] = job_service
     logger.info("Job service initialized")
 
+    # Server-side order storage (the session cookie only holds the order_id)
+    app.config["ORDER_STORE"] = OrderStore(ttl_seconds=app.config["ORDER_TTL_SECONDS"])
+
     # =========================================================================
     # HELPER MODULES
     # =========================================================================
@@ -198,37 +240,13 @@ def create_app() -> Flask:
     # Note: JobEstimator needs inventory, but we'll adapt it
     app.config["ESTIMATOR"] = JobEstimator(inventory_service)
 
-    # Printer config and image defaults modules (for sidebar)
-    import modules.printer_config as printer_config_module
-    import modules.consumable_details as consumable_details_module
-    import modules.image_defaults as image_defaults_module
-    app.config["PRINTER_CONFIG_MODULE"] = printer_config_module
-    app.config["CONSUMABLE_DETAILS_MODULE"] = consumable_details_module
-    app.config["IMAGE_DEFAULTS_MODULE"] = image_defaults_module
-
     # =========================================================================
     # CLEANUP REGISTRATION
     # =========================================================================
 
-    def cleanup():
-        """Cleanup on application shutdown."""
-        logger.info("Shutting down...")
-
-        # Stop inventory service
-        if inventory_service:
-            inventory_service.stop()
-
-        # Wait for job threads
-        if job_service:
-            job_service.shutdown()
-
-        # Close DLL context
-        if dll_manager:
-            dll_manager.cleanup()
-
-        logger.info("Shutdown complete")
-
-    atexit.register(cleanup)
+    # Module-level function bound to the app, so atexit does not keep this
+    # factory's frame alive through a closure
+    atexit.register(_cleanup, app)
 
     # =========================================================================
     # REGISTER BLUEPRINTS
@@ -236,6 +254,10 @@ def create_app() -> Flask:
 
     register_blueprints(app)
 
+    # The error handlers and language switch all fall back to the upload
+    # page (resolved once by register_blueprints)
+    upload_url = app.config["ROUTE_URLS"]["upload.upload"]
+
     # =========================================================================
     # CONTEXT PROCESSORS
     # =========================================================================
@@ -245,139 +267,88 @@ def create_app() -> Flask:
         """Inject translation function into all templates."""
         current_lang = session.get("language", DEFAULT_LANGUAGE)
         return {
-            "_": create_translation_filter(current_lang),
+            "_": get_translation_filter(current_lang),
             "current_language": current_lang,
-            "supported_languages": get_supported_languages(),
+            "supported_languages": _SUPPORTED_LANGUAGES,
         }
 
+    # The printer context only changes when the inventory service publishes a
+    # new snapshot (or the snapshot crosses the staleness threshold), so it is
+    # built once per (version, is_stale) and shared by every request until then.
+    # The entry is a single (key, context) tuple so readers never see a key
+    # paired with another snapshot's context.
+    printer_context_cache = {"entry": (None, None)}
+    printer_context_lock = threading.Lock()
+
     @app.context_processor
     def inject_printer_config():
         """Inject printer configuration into all templates."""
-        from modules.consumable_details import get_consumable_details
-
         try:
             snapshot = inventory_service.get_snapshot()
 
-            if not snapshot.toner_balances and not snapshot.media_options:
+            if snapshot.health is InventoryHealth.UNAVAILABLE:
                 return _empty_printer_context()
 
-            # Build toner dict with display names from raw template
-            toner_dict = {}
-            for t in snapshot.toner_balances:
-                # Get display name from raw_template (projectData.Consumable Name)
-                display_name = t.color.title()  # Default fallback
-                account = snapshot.get_full_account_data(t.color, "toner")
-                if account:
-                    outer_meta = account.get("metadata", {})
-                    inner_meta = outer_meta.get("metadata", {})
-                    token_desc = inner_meta.get("tokenDescription", {})
-                    project_data = token_desc.get("projectData", {})
-                    display_name = project_data.get("Consumable Name", display_name)
-
-                toner_dict[t.color] = {
-                    "available": t.balance_ml,
-                    "mintId": t.mint_id,
-                    "display": display_name,
-                }
-
-            printer = update_printer_from_inventory(toner_dict)
-
-            # Build media dict with display names
-            media_dict = {}
-            for m in snapshot.media_options:
-                # Get display name from raw_template
-                display_name = m.display_name  # Default from snapshot
-                account = snapshot.get_full_account_data(m.mint_id, "media")
-                if account:
-                    outer_meta = account.get("metadata", {})
-                    inner_meta = outer_meta.get("metadata", {})
-                    token_desc = inner_meta.get("tokenDescription", {})
-                    project_data = token_desc.get("projectData", {})
-                    display_name = project_data.get("Consumable Name", display_name)
-
-                media_dict[m.mint_id] = {
-                    "available": m.balance_sheets,
-                    "display": display_name,
-                }
-
-            # Build inventory dict (for compatibility with existing code)
-            inventory = {
-                "toner_balances": toner_dict,
-                "media_options": media_dict,
-                "is_stale": snapshot.is_stale,
-                "toner_profiles": {
-                    "full_color": ["cyan", "magenta", "yellow", "black"],
-                    "mono": ["black"],
-                },
-                "default_turnaround_options": ["standard", "rush", "economy"],
-            }
-
-            # Extract consumable details from raw_template for sidebar display
-            toner_details = {}
-            for toner in snapshot.toner_balances:
-                account = snapshot.get_full_account_data(toner.color, "toner")
-                if account:
-                    toner_details[toner.color] = get_consumable_details("toner", account, inventory)
-
-            media_details = {}
-            for media in snapshot.media_options:
-                account = snapshot.get_full_account_data(media.mint_id, "media")
-                if account:
-                    media_details[media.mint_id] = get_consumable_details("media", account, inventory)
-
-            return {
-                "printer": printer,
-                "inventory": inventory,
-                "toner_details": toner_details,
-                "media_details": media_details,
-                "unattached_consumables": [],
-                "default_images": {
-                    'toner': get_default_image('Toner'),
-                    'media': get_default_image('Media'),
-                }
-            }
+            is_stale = snapshot.is_stale
+            if is_stale:
+                # Non-blocking: this render still uses the stale snapshot
+                inventory_service.request_refresh()
+
+            key = (snapshot.version, is_stale)
+            cached_key, cached_context = printer_context_cache["entry"]
+            if cached_key == key:
+                return cached_context
+
+            with printer_context_lock:
+                # Another request may have rebuilt it while we waited
+                cached_key, cached_context = printer_context_cache["entry"]
+                if cached_key != key:
+                    cached_context = _build_printer_context(snapshot, is_stale)
+                    printer_context_cache["entry"] = (key, cached_context)
+                return cached_context
 
         except Exception as e:
-            logger.error(f"Failed to inject printer config: {e}")
+            # Not cached - the next request retries the build. Until then,
+            # keep serving the last context that built successfully.
+            logger.error("Failed to inject printer config: %s", e)
+            _, last_good_context = printer_context_cache["entry"]
+            return last_good_context or _empty_printer_context()
+
+    def _build_printer_context(snapshot, is_stale):
+        """Overlay per-render values on the snapshot's prebuilt context."""
+        display_context = snapshot.display_context
+        if not display_context:
             return _empty_printer_context()
 
+        return with_render_values(display_context, is_stale)
+
     def _empty_printer_context():
         """Return empty printer context for error cases."""
-        return {
-            "printer": get_printer_config(),
-            "inventory": {"error": "Unavailable", "toner_balances": {}, "media_options": {}},
-            "toner_details": {},
-            "media_details": {},
-            "unattached_consumables": [],
-            "default_images": {
-                'toner': get_default_image('Toner'),
-                'media': get_default_image('Media'),
-            }
-        }
+        return _EMPTY_PRINTER_CONTEXT
 
     # =========================================================================
     # ERROR HANDLERS
     # =========================================================================
 
+    # Config is fixed once the factory returns, so the message is built once
+    max_mb = app.config.get("MAX_CONTENT_LENGTH", 16 * 1024 * 1024) / (1024 * 1024)
+    file_too_large_message = f"File too large. Maximum upload size is {max_mb:.0f} MB."
+
     @app.errorhandler(RequestEntityTooLarge)
     def handle_file_too_large(e):
-        from flask import flash, redirect, url_for
-        max_mb = app.config.get("MAX_CONTENT_LENGTH", 16 * 1024 * 1024) / (1024 * 1024)
-        flash(f"File too large. Maximum upload size is {max_mb:.0f} MB.", "error")
-        return redirect(url_for("upload.upload"))
+        flash(file_too_large_message, "error")
+        return redirect(upload_url)
 
     @app.errorhandler(404)
     def handle_not_found(e):
-        from flask import flash, redirect, url_for
         flash("Page not found.", "warning")
-        return redirect(url_for("upload.upload"))
+        return redirect(upload_url)
 
     @app.errorhandler(500)
     def handle_server_error(e):
-        from flask import flash, redirect, url_for
-        logger.error(f"500 error: {e}", exc_info=True)
+        logger.error("500 error: %s", e, exc_info=True)
         flash("An unexpected error occurred. Please try again.", "error")
-        return redirect(url_for("upload.upload"))
+        return redirect(upload_url)
 
     # =========================================================================
     # LANGUAGE ROUTE
@@ -385,14 +356,15 @@ def create_app() -> Flask:
 
     @app.route("/set_language/<lang>", methods=["GET"])
     def set_language(lang: str):
-        from flask import flash, redirect, request, url_for
-        if lang in get_supported_languages():
-            session["language"] = lang
-            session.modified = True
-            flash(f"Language changed to {get_supported_languages()[lang]['name']}.", "success")
+        if lang in _SUPPORTED_LANGUAGE_CODES:
+            # Only touch the session when the language actually changes;
+            # re-assigning the same value would still re-sign the cookie
+            if session.get("language") != lang:
+                session["language"] = lang
+            flash(f"Language changed to {_SUPPORTED_LANGUAGES[lang]['name']}.", "success")
         else:
             flash(f"Unsupported language: {lang}", "error")
-        return redirect(request.referrer or url_for("upload.upload"))
+        return redirect(request.referrer or upload_url)
 
     logger.info("Application initialized successfully")
     return app
@@ -437,9 +409,9 @@ if __name__ == "__main__":
         url = "http://127.0.0.1:5000"
         try:
             webbrowser.open(url)
-            logger.info(f"Browser opened to {url}")
+            logger.info("Browser opened to %s", url)
         except Exception as e:
-            logger.warning(f"Could not open browser automatically: {e}")
+            logger.warning("Could not open browser automatically: %s", e)
 
     # WERKZEUG_RUN_MAIN is set to "true" in Flask's reloader CHILD process.
     # We want to open browser in the CHILD (where the actual server runs),
@@ -6,10 +6,13 @@ Application will fail-fast if DLL cannot be loaded.
 """
 
 import os
+import sys
 from pathlib import Path
 
 from dotenv import load_dotenv
 
+from logging_config import get_logger
+
 # Load .env file early so environment variables are available for Config class
 # This must happen before the Config class is defined
 load_dotenv(override=True)
@@ -18,6 +21,29 @@ load_dotenv(override=True)
 BASE_DIR = Path(__file__).resolve().parent
 
 
+def _job_workers_from_env() -> int:
+    """
+    Read JOB_WORKERS from the environment.
+
+    Returns:
+        Worker count >= 1, or 0 (default) if unset, invalid or negative
+    """
+    value = os.environ.get("JOB_WORKERS", "0")
+    try:
+        workers = int(value)
+    except ValueError:
+        workers = -1
+
+    if workers < 0:
+        get_logger(__name__).warning(
+            "Invalid JOB_WORKERS=%r (must be >= 1, or 0 for the default) - using default",
+            value
+        )
+        return 0
+
+    return workers
+
+
 class Config:
     """Default configuration for the Flask application."""
 
@@ -28,6 +54,10 @@ class Config:
     )
     MAX_CONTENT_LENGTH = 16 * 1024 * 1024  # 16 MB uploads
     SESSION_COOKIE_NAME = "print_order_session"
+
+    # Seconds an in-progress order may go unused before the server-side
+    # order store drops it (see OrderStore)
+    ORDER_TTL_SECONDS = 3600
     ENVIRONMENT = os.environ.get("FLASK_ENV", "development")
 
     # ConsumableClient DLL path
@@ -41,6 +71,15 @@ class Config:
     # Debug mode
     DEBUG = os.environ.get("FLASK_DEBUG", "1") == "1"
 
+    # Template auto-reload. None follows DEBUG (Flask default). PyInstaller
+    # builds bundle the templates read-only, so Jinja's per-render stat()
+    # of every template file is pure overhead there even with debug on.
+    TEMPLATES_AUTO_RELOAD = False if getattr(sys, "frozen", False) else None
+
+    # Maximum concurrent job submissions (job worker threads).
+    # 0 = default, which scales with the CPU count (see JobService).
+    JOB_WORKERS = _job_workers_from_env()
+
     # ==========================================================================
     # Estimator Configuration (for demos/testing)
     # ==========================================================================
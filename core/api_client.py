@@ -9,6 +9,9 @@ THREAD SAFETY:
     - Each thread creates its own ConsumableAPIClient instance
     - All instances share the same DLL context handle (thread-safe by DLL design)
     - Each API call returns independent data (no shared state between calls)
+    - The library is a ctypes.CDLL, which releases the GIL for the duration of
+      every foreign call, so a blocking ld3s_submit_job in one thread does not
+      stall status polls in another (a PyDLL would hold the GIL - don't use one)
 
 NO STUB MODE:
     This is production-only code. There is no stub/mock implementation.
@@ -39,13 +42,79 @@ from __future__ import annotations
 
 import json
 import logging
+import re
 import threading
 import time
-from ctypes import c_void_p, c_char_p, c_uint64
-from typing import Dict, Any, Optional
+from ctypes import c_void_p, c_uint64, string_at
+from typing import Dict, Any, Optional, Union
 
 from .exceptions import BlockchainTimeoutError, JobSubmissionError
 
+# orjson parses/serializes the (large) template and status payloads several
+# times faster than the stdlib and works on bytes directly, so DLL responses
+# never need an intermediate str decode. It is optional - fall back to stdlib.
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can keep
+# catching the stdlib exception type either way.
+try:
+    import orjson
+
+    def _json_loads(data: bytes) -> Any:
+        return orjson.loads(data)
+
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+except ImportError:  # pragma: no cover - depends on environment
+    def _json_loads(data: bytes) -> Any:
+        return json.loads(data)
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+# pysimdjson gives lazy document proxies: only the keys we touch are turned
+# into Python objects. wait_for_job_completion uses it to read "final" from
+# non-final status polls without building the whole status dict. Optional.
+try:
+    import simdjson
+except ImportError:  # pragma: no cover - depends on environment
+    simdjson = None
+
+# simdjson parsers are not thread-safe but are expensive to create (they own
+# the parse buffers). Keep one per thread, shared by every client that thread
+# creates (a thread replaces its client after a failed inventory refresh).
+_parser_local = threading.local()
+
+
+def _status_parser():
+    """Get this thread's simdjson parser, creating it on first use."""
+    parser = getattr(_parser_local, "parser", None)
+    if parser is None:
+        parser = _parser_local.parser = simdjson.Parser()
+    return parser
+
+# Status polling backs off exponentially from a few milliseconds up to the
+# caller's polling interval: fast jobs are noticed almost immediately while
+# long jobs still settle at the configured interval.
+_INITIAL_POLL_INTERVAL_SEC = 0.005
+_POLL_BACKOFF_FACTOR = 1.5
+
+# A "final" key with a falsy JSON literal. Intermediate status polls all
+# look like this and are rejected without parsing (see _parse_final_status)
+_NOT_FINAL_RE = re.compile(rb'"final"\s*:\s*(?:false|null|0)\s*[,}]')
+
+# Max bytes of an unparseable DLL response to include in error logs
+_RESPONSE_PREVIEW_BYTES = 200
+
+
+def _preview(data: bytes) -> str:
+    """
+    Short printable preview of a raw DLL response for error logs.
+
+    Only the head of the payload is decoded, never the full (possibly
+    multi-MB) response.
+    """
+    return data[:_RESPONSE_PREVIEW_BYTES].decode('utf-8', 'replace')
+
 
 class ConsumableAPIClient:
     """
@@ -74,14 +143,15 @@ class ConsumableAPIClient:
         self,
         context_handle: int,
         library,
-        logger: Optional[logging.Logger] = None
+        logger: Optional[Union[logging.Logger, logging.LoggerAdapter]] = None
     ):
         """
         Initialize thread-safe API client.
 
         Args:
             context_handle: DLL context from DLLManager.context_handle
-            library: Shared ctypes.CDLL from DLLManager.library
+            library: Shared ctypes.CDLL from DLLManager.library (function
+                signatures already configured)
             logger: Logger instance (creates default if not provided)
 
         Raises:
@@ -98,46 +168,31 @@ class ConsumableAPIClient:
         self._logger = logger or logging.getLogger("core.api_client")
         self._thread_id = threading.get_ident()
 
-        # Configure DLL function signatures
-        self._setup_functions()
+        # Bind the API functions once; calls then skip the CDLL attribute lookup.
+        # Their signatures were configured when DLLManager loaded the library.
+        self._ld3s_new_job = library.ld3s_new_job
+        self._ld3s_submit_job = library.ld3s_submit_job
+        self._ld3s_get_job_status = library.ld3s_get_job_status
+        self._ld3s_free = library.ld3s_free
+        self._ld3s_get_last_error = library.ld3s_get_last_error
 
-        self._logger.debug(f"[Thread {self._thread_id}] ConsumableAPIClient initialized")
+        self._logger.debug("[Thread %s] ConsumableAPIClient initialized", self._thread_id)
 
     @property
     def thread_id(self) -> int:
         """ID of the thread that owns this client."""
         return self._thread_id
 
-    def _setup_functions(self) -> None:
-        """
-        Configure DLL function signatures.
+    @property
+    def logger(self) -> Union[logging.Logger, logging.LoggerAdapter]:
+        """Logger used for this client's messages."""
+        return self._logger
 
-        This is idempotent - safe to call multiple times on the shared library.
-        Sets up argument types and return types for all API functions.
-        """
-        # ld3s_new_job - fetch template from blockchain
-        # Returns: JSON string (char*) with inventory and job parameters
-        self._lib.ld3s_new_job.argtypes = [c_void_p]
-        self._lib.ld3s_new_job.restype = c_char_p
-
-        # ld3s_submit_job - submit job payload to blockchain
-        # Returns: Job handle (uint64) for status polling
-        self._lib.ld3s_submit_job.argtypes = [c_void_p, c_char_p]
-        self._lib.ld3s_submit_job.restype = c_uint64
-
-        # ld3s_get_job_status - poll job status
-        # Returns: JSON string (char*) with status info, or NULL if not ready
-        self._lib.ld3s_get_job_status.argtypes = [c_void_p, c_uint64]
-        self._lib.ld3s_get_job_status.restype = c_char_p
-
-        # ld3s_free - free memory allocated by DLL
-        # MUST be called for all returned char* pointers
-        self._lib.ld3s_free.argtypes = [c_void_p, c_void_p]
-        self._lib.ld3s_free.restype = None
-
-        # ld3s_get_last_error - get error message for failed calls
-        self._lib.ld3s_get_last_error.argtypes = [c_void_p]
-        self._lib.ld3s_get_last_error.restype = c_char_p
+    @logger.setter
+    def logger(self, logger: Union[logging.Logger, logging.LoggerAdapter]) -> None:
+        # A worker thread reuses its client across jobs and points it at
+        # each job's logger in turn
+        self._logger = logger
 
     def new_job_template(self) -> Dict[str, Any]:
         """
@@ -155,43 +210,41 @@ class ConsumableAPIClient:
         Raises:
             RuntimeError: If API call fails or response is invalid
         """
-        self._logger.debug(f"[Thread {self._thread_id}] Fetching job template...")
+        self._logger.debug("[Thread %s] Fetching job template...", self._thread_id)
 
         # Call DLL function
-        result_ptr = self._lib.ld3s_new_job(self._context)
+        result_ptr = self._ld3s_new_job(self._context)
 
         if not result_ptr:
             error = self._get_last_error()
-            self._logger.error(f"[Thread {self._thread_id}] ld3s_new_job failed: {error}")
+            self._logger.error("[Thread %s] ld3s_new_job failed: %s", self._thread_id, error)
             raise RuntimeError(f"Failed to fetch job template: {error}")
 
+        # Copy out and release the DLL buffer before parsing
+        raw_template = self._take_string(result_ptr)
+
         try:
-            # Parse JSON response
-            json_str = result_ptr.decode('utf-8')
-            template = json.loads(json_str)
-
-            # Log summary (not full template - it's huge)
-            # Use DEBUG level to avoid filling logs during 30-second inventory refreshes
-            # Job submission still logs important events at INFO level
-            wallets = template.get("inventoryParameters", {}).get("wallets", [])
-            account_count = sum(len(w.get("accounts", [])) for w in wallets)
-            self._logger.debug(
-                f"[Thread {self._thread_id}] Template fetched: {account_count} accounts"
+            # Parse JSON response (bytes straight from the DLL, no str decode)
+            template = _json_loads(raw_template)
+        except ValueError as e:
+            # UnicodeDecodeError and (orjson) JSONDecodeError are both ValueErrors
+            self._logger.error(
+                "[Thread %s] Invalid JSON in template: %s (%s bytes, starts %r)",
+                self._thread_id, e, len(raw_template), _preview(raw_template)
             )
-
-            return template
-
-        except UnicodeDecodeError as e:
-            self._logger.error(f"[Thread {self._thread_id}] Failed to decode template: {e}")
-            raise RuntimeError(f"Failed to decode template response: {e}")
-
-        except json.JSONDecodeError as e:
-            self._logger.error(f"[Thread {self._thread_id}] Invalid JSON in template: {e}")
             raise RuntimeError(f"Invalid JSON in template response: {e}")
 
-        finally:
-            # IMPORTANT: Free memory allocated by DLL
-            self._lib.ld3s_free(self._context, result_ptr)
+        # Log summary (not full template - it's huge)
+        # Use DEBUG level to avoid filling logs during 30-second inventory refreshes
+        # Job submission still logs important events at INFO level
+        wallets = template.get("inventoryParameters", {}).get("wallets", [])
+        account_count = sum(len(w.get("accounts", [])) for w in wallets)
+        self._logger.debug(
+            "[Thread %s] Template fetched: %s accounts",
+            self._thread_id, account_count
+        )
+
+        return template
 
     def submit_job(self, payload: Dict[str, Any]) -> int:
         """
@@ -210,24 +263,24 @@ class ConsumableAPIClient:
         Raises:
             JobSubmissionError: If submission fails
         """
-        self._logger.debug(f"[Thread {self._thread_id}] Submitting job...")
+        self._logger.debug("[Thread %s] Submitting job...", self._thread_id)
 
         # Serialize payload to JSON
         try:
-            payload_json = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+            payload_json = _json_dumps(payload)
         except (TypeError, ValueError) as e:
-            self._logger.error(f"[Thread {self._thread_id}] Failed to serialize payload: {e}")
+            self._logger.error("[Thread %s] Failed to serialize payload: %s", self._thread_id, e)
             raise JobSubmissionError(f"Failed to serialize job payload: {e}")
 
         # Call DLL function
-        job_handle = self._lib.ld3s_submit_job(self._context, payload_json)
+        job_handle = self._ld3s_submit_job(self._context, payload_json)
 
         if not job_handle:
             error = self._get_last_error()
-            self._logger.error(f"[Thread {self._thread_id}] ld3s_submit_job failed: {error}")
+            self._logger.error("[Thread %s] ld3s_submit_job failed: %s", self._thread_id, error)
             raise JobSubmissionError(f"Job submission failed: {error}")
 
-        self._logger.info(f"[Thread {self._thread_id}] Job submitted: handle={job_handle}")
+        self._logger.info("[Thread %s] Job submitted: handle=%s", self._thread_id, job_handle)
         return job_handle
 
     def get_job_status(self, job_handle: int) -> Optional[Dict[str, Any]]:
@@ -250,35 +303,121 @@ class ConsumableAPIClient:
             - transactionSuccess: bool - True if transaction succeeded
             - results: list - Result details for each consumable
         """
-        self._logger.debug(f"[Thread {self._thread_id}] Checking status for handle {job_handle}")
+        raw_status = self._fetch_status_bytes(c_uint64(job_handle))
 
-        # Call DLL function
-        result_ptr = self._lib.ld3s_get_job_status(self._context, c_uint64(job_handle))
-
-        if not result_ptr:
+        if raw_status is None:
             # No status available yet - job still processing
             return None
 
         try:
-            # Parse JSON response
-            json_str = result_ptr.decode('utf-8')
-            status = json.loads(json_str)
-
-            is_final = status.get("final", False)
-            status_str = status.get("status", "unknown")
-            self._logger.debug(
-                f"[Thread {self._thread_id}] Status: {status_str}, final={is_final}"
+            # Parse JSON response (bytes straight from the DLL, no str decode)
+            status = _json_loads(raw_status)
+        except ValueError as e:
+            # UnicodeDecodeError and (orjson) JSONDecodeError are both ValueErrors
+            self._logger.error(
+                "[Thread %s] Failed to parse status: %s (%s bytes, starts %r)",
+                self._thread_id, e, len(raw_status), _preview(raw_status)
             )
+            return None
+
+        self._logger.debug(
+            "[Thread %s] Status: %s, final=%s",
+            self._thread_id, status.get("status", "unknown"), status.get("final", False)
+        )
+
+        return status
+
+    def _fetch_status_bytes(self, job_handle: c_uint64) -> Optional[bytes]:
+        """
+        Fetch the raw status JSON for a job without parsing it.
 
-            return status
+        Args:
+            job_handle: Job handle from submit_job(), already wrapped as
+                c_uint64 so polling loops can box it once and reuse it
+
+        Returns:
+            Status JSON bytes, or None if no status is available yet
+        """
+        self._logger.debug(
+            "[Thread %s] Checking status for handle %s",
+            self._thread_id, job_handle.value
+        )
 
-        except (UnicodeDecodeError, json.JSONDecodeError) as e:
-            self._logger.error(f"[Thread {self._thread_id}] Failed to parse status: {e}")
+        # Call DLL function
+        result_ptr = self._ld3s_get_job_status(self._context, job_handle)
+
+        if not result_ptr:
             return None
 
+        return self._take_string(result_ptr)
+
+    def _take_string(self, ptr: int) -> bytes:
+        """
+        Copy a DLL-allocated C string into Python bytes and free it.
+
+        The DLL buffer is released immediately, before any parsing, so it is
+        never held alongside the Python copy for longer than the memcpy.
+
+        Args:
+            ptr: Non-NULL char* returned by the DLL (as an int, c_void_p restype)
+
+        Returns:
+            Python-owned copy of the string's bytes
+        """
+        try:
+            return string_at(ptr)
         finally:
-            # IMPORTANT: Free memory allocated by DLL
-            self._lib.ld3s_free(self._context, result_ptr)
+            # IMPORTANT: Free memory allocated by DLL - must be the DLL's own
+            # pointer, not the address of a Python copy
+            self._ld3s_free(self._context, ptr)
+
+    def _parse_final_status(self, raw_status: bytes) -> Optional[Dict[str, Any]]:
+        """
+        Parse a status payload only if it is final.
+
+        Payloads without a "final" key, or whose only "final" key has a
+        false, null or 0 value, are rejected without parsing. Any other
+        payload is parsed, so every truthy "final" value counts. With
+        simdjson, a parsed payload that turns out non-final only
+        materializes the "final" key; the full dict is built once, for the
+        final status. Without simdjson this falls back to a full parse.
+
+        The simdjson document is local to this method so it is released
+        before the thread's parser is reused on the next poll.
+
+        Args:
+            raw_status: Status JSON bytes from _fetch_status_bytes()
+
+        Returns:
+            Fully materialized status dict if final, None otherwise
+            (including when the payload cannot be parsed)
+        """
+        # Cheap byte checks: most polls are '"final": false' and never reach
+        # a parser. With more than one "final" (e.g. a nested key) the match
+        # might not be the top-level key, so those payloads are parsed.
+        final_keys = raw_status.count(b'"final"')
+        if not final_keys:
+            return None
+        if final_keys == 1 and _NOT_FINAL_RE.search(raw_status):
+            return None
+
+        try:
+            if simdjson is None:
+                status = _json_loads(raw_status)
+                return status if status.get("final", False) else None
+
+            doc = _status_parser().parse(raw_status)
+            if not doc.get("final", False):
+                return None
+            return doc.as_dict()
+
+        except ValueError as e:
+            # json.JSONDecodeError, orjson and simdjson errors are all ValueErrors
+            self._logger.error(
+                "[Thread %s] Failed to parse status: %s (%s bytes, starts %r)",
+                self._thread_id, e, len(raw_status), _preview(raw_status)
+            )
+            return None
 
     def wait_for_job_completion(
         self,
@@ -290,12 +429,15 @@ class ConsumableAPIClient:
         Poll job status until completion or timeout.
 
         This is a blocking call that runs in the calling thread.
-        It repeatedly calls get_job_status() until the job is complete.
+        It repeatedly polls the job status until the job is complete. Only the
+        final status is fully parsed into a dict.
 
         Args:
             job_handle: Job handle from submit_job()
             timeout_seconds: Maximum seconds to wait (default 60)
-            polling_interval_ms: Milliseconds between polls (default 250)
+            polling_interval_ms: Maximum milliseconds between polls (default 250).
+                Polling starts at 5ms and backs off to this cap; it drops back
+                to 5ms whenever the status payload changes.
 
         Returns:
             Final job status dictionary
@@ -304,39 +446,61 @@ class ConsumableAPIClient:
             BlockchainTimeoutError: If timeout occurs before completion
         """
         self._logger.info(
-            f"[Thread {self._thread_id}] Waiting for job {job_handle} "
-            f"(timeout={timeout_seconds}s, poll_interval={polling_interval_ms}ms)"
+            "[Thread %s] Waiting for job %s (timeout=%ss, poll_interval=%sms)",
+            self._thread_id, job_handle, timeout_seconds, polling_interval_ms
         )
 
-        start_time = time.time()
-        polling_interval_sec = polling_interval_ms / 1000.0
+        # Loop-invariant lookups, bound once for the whole wait
+        monotonic = time.monotonic
+        sleep = time.sleep
+        fetch_status_bytes = self._fetch_status_bytes
+        parse_final_status = self._parse_final_status
+
+        # Monotonic deadline: immune to wall-clock changes, one comparison per poll
+        start_time = monotonic()
+        deadline = start_time + timeout_seconds
+        max_interval_sec = polling_interval_ms / 1000.0
+        interval_sec = min(_INITIAL_POLL_INTERVAL_SEC, max_interval_sec)
+        last_raw_status = None
+        # Box the handle once for the whole wait instead of once per poll
+        handle_c = c_uint64(job_handle)
 
         while True:
             # Check timeout
-            elapsed = time.time() - start_time
-            if elapsed > timeout_seconds:
+            if monotonic() > deadline:
+                elapsed = monotonic() - start_time
                 self._logger.error(
-                    f"[Thread {self._thread_id}] Job {job_handle} timed out after {elapsed:.1f}s"
+                    "[Thread %s] Job %s timed out after %.1fs",
+                    self._thread_id, job_handle, elapsed
                 )
                 raise BlockchainTimeoutError(
                     operation="wait_for_completion",
                     timeout_seconds=timeout_seconds
                 )
 
-            # Poll status
-            status = self.get_job_status(job_handle)
+            # Poll status - non-final payloads are only inspected lazily
+            raw_status = fetch_status_bytes(handle_c)
 
-            if status:
-                is_final = status.get("final", False)
+            if raw_status is not None:
+                status = parse_final_status(raw_status)
 
-                if is_final:
+                if status is not None:
+                    elapsed = monotonic() - start_time
                     self._logger.info(
-                        f"[Thread {self._thread_id}] Job {job_handle} completed after {elapsed:.1f}s"
+                        "[Thread %s] Job %s completed after %.1fs",
+                        self._thread_id, job_handle, elapsed
                     )
                     return status
 
+            # Any change in the status payload means the job is progressing -
+            # poll quickly again; otherwise keep backing off toward the cap
+            if raw_status != last_raw_status:
+                last_raw_status = raw_status
+                interval_sec = min(_INITIAL_POLL_INTERVAL_SEC, max_interval_sec)
+
             # Wait before next poll
-            time.sleep(polling_interval_sec)
+            sleep(interval_sec)
+            interval_sec = min(interval_sec * _POLL_BACKOFF_FACTOR, max_interval_sec)
 
     def _get_last_error(self) -> str:
         """
@@ -347,16 +511,14 @@ class ConsumableAPIClient:
         Returns:
             Error message string, or "Unknown error" if not available
         """
-        error_ptr = self._lib.ld3s_get_last_error(self._context)
-
-        if error_ptr:
-            try:
-                error_msg = error_ptr.decode('utf-8')
-                return error_msg
-            except UnicodeDecodeError:
-                return "Unknown error (failed to decode error message)"
-            finally:
-                # Free memory
-                self._lib.ld3s_free(self._context, error_ptr)
-
-        return "Unknown error"
+        error_ptr = self._ld3s_get_last_error(self._context)
+
+        if not error_ptr:
+            return "Unknown error"
+
+        # Copy out and release the DLL buffer (single copy, see _take_string)
+        raw_error = self._take_string(error_ptr)
+        try:
+            return raw_error.decode('utf-8')
+        except UnicodeDecodeError:
+            return "Unknown error (failed to decode error message)"
@@ -10,6 +10,9 @@ THREAD SAFETY:
     - cleanup() must be called from main thread only
     - context_handle and library properties are read-only and thread-safe
     - Worker threads use these properties to create their own API clients
+    - The library is a ctypes.CDLL, which releases the GIL during each DLL
+      call, so template fetches and status polls in different threads run
+      concurrently (a PyDLL would hold the GIL and serialize them)
 
 FAIL FAST BEHAVIOR:
     - If DLL file not found: raises DLLNotFoundError
@@ -34,20 +37,88 @@ Usage:
 
 from __future__ import annotations
 
+import functools
 import logging
-from ctypes import cdll, c_void_p
+from ctypes import CDLL, cdll, c_char_p, c_uint64, c_void_p
 from pathlib import Path
 from typing import Optional
 
 from .exceptions import DLLNotFoundError, ServiceUnavailableError
 
 
+@functools.lru_cache(maxsize=None)
+def _load_library(dll_path: str) -> CDLL:
+    """
+    Load the DLL and set all function signatures, once per path.
+
+    Every ConsumableAPIClient shares the returned library, so the API
+    signatures are configured here, before any worker thread exists,
+    rather than by the clients.
+
+    A DLL stays mapped for the life of the process anyway, so re-initializing
+    (a second DLLManager, or initialize() after cleanup()) reuses the loaded
+    library instead of loading it and configuring it again. Failed loads are
+    not cached.
+
+    Args:
+        dll_path: Path to ConsumableClient.dll
+
+    Returns:
+        Loaded library
+
+    Raises:
+        OSError: If the library cannot be loaded
+    """
+    # Must stay the cdll loader: a PyDLL holds the GIL during calls, which
+    # would serialize every worker thread's DLL calls
+    library = cdll.LoadLibrary(dll_path)
+
+    # Setup ld3s_open function signature
+    library.ld3s_open.argtypes = []
+    library.ld3s_open.restype = c_void_p
+
+    # Setup ld3s_close function signature
+    library.ld3s_close.argtypes = [c_void_p]
+    library.ld3s_close.restype = None
+
+    # ld3s_new_job - fetch template from blockchain
+    # Returns: JSON string (char*) with inventory and job parameters.
+    # Declared c_void_p (not c_char_p) so we keep the DLL's own pointer
+    # to pass to ld3s_free - see ConsumableAPIClient._take_string()
+    library.ld3s_new_job.argtypes = [c_void_p]
+    library.ld3s_new_job.restype = c_void_p
+
+    # ld3s_submit_job - submit job payload to blockchain
+    # Returns: Job handle (uint64) for status polling
+    library.ld3s_submit_job.argtypes = [c_void_p, c_char_p]
+    library.ld3s_submit_job.restype = c_uint64
+
+    # ld3s_get_job_status - poll job status
+    # Returns: JSON string (char*) with status info, or NULL if not ready
+    library.ld3s_get_job_status.argtypes = [c_void_p, c_uint64]
+    library.ld3s_get_job_status.restype = c_void_p
+
+    # ld3s_free - free memory allocated by DLL
+    # MUST be called for all returned char* pointers
+    library.ld3s_free.argtypes = [c_void_p, c_void_p]
+    library.ld3s_free.restype = None
+
+    # ld3s_get_last_error - get error message for failed calls
+    # Returns: char* that must be passed to ld3s_free - c_void_p like
+    # ld3s_new_job, so the DLL's pointer (not a Python copy) is freed
+    library.ld3s_get_last_error.argtypes = [c_void_p]
+    library.ld3s_get_last_error.restype = c_void_p
+
+    return library
+
+
 class DLLManager:
     """
     Manages ConsumableClient.dll lifecycle.
 
     This class is responsible for:
-    1. Loading the DLL at application startup
+    1. Loading the DLL at application startup (and configuring the
+       signatures of every API function)
     2. Calling ld3s_open() to initialize the context
     3. Providing read-only access to the context handle for worker threads
     4. Calling ld3s_close() at application shutdown
@@ -138,29 +209,21 @@ class DLLManager:
         if self._is_initialized:
             raise RuntimeError("DLL already initialized")
 
-        self._logger.info(f"[MainThread] Initializing DLL: {self._dll_path}")
+        self._logger.info("[MainThread] Initializing DLL: %s", self._dll_path)
 
         # FAIL FAST: DLL must exist
         if not self._dll_path.exists():
-            self._logger.critical(f"[MainThread] DLL not found: {self._dll_path}")
+            self._logger.critical("[MainThread] DLL not found: %s", self._dll_path)
             raise DLLNotFoundError(str(self._dll_path))
 
-        # Load the DLL
+        # Load the DLL (reused if this process already loaded it)
         try:
-            self._library = cdll.LoadLibrary(str(self._dll_path))
-            self._logger.info(f"[MainThread] DLL loaded successfully")
+            self._library = _load_library(str(self._dll_path))
+            self._logger.info("[MainThread] DLL loaded successfully")
         except OSError as e:
-            self._logger.critical(f"[MainThread] Failed to load DLL: {e}")
+            self._logger.critical("[MainThread] Failed to load DLL: %s", e)
             raise ServiceUnavailableError(f"Failed to load DLL: {e}")
 
-        # Setup ld3s_open function signature
-        self._library.ld3s_open.argtypes = []
-        self._library.ld3s_open.restype = c_void_p
-
-        # Setup ld3s_close function signature
-        self._library.ld3s_close.argtypes = [c_void_p]
-        self._library.ld3s_close.restype = None
-
         # Call ld3s_open to get context handle
         self._logger.info("[MainThread] Calling ld3s_open()...")
         context = self._library.ld3s_open()
@@ -176,7 +239,7 @@ class DLLManager:
         self._context_handle = context
         self._is_initialized = True
 
-        self._logger.info(f"[MainThread] DLL context initialized: {context}")
+        self._logger.info("[MainThread] DLL context initialized: %s", context)
         return context
 
     def cleanup(self) -> None:
@@ -196,7 +259,7 @@ class DLLManager:
                 self._library.ld3s_close(c_void_p(self._context_handle))
                 self._logger.info("[MainThread] DLL context closed successfully")
             except Exception as e:
-                self._logger.error(f"[MainThread] Error closing DLL context: {e}")
+                self._logger.error("[MainThread] Error closing DLL context: %s", e)
 
         self._context_handle = None
         self._is_initialized = False
@@ -210,29 +210,43 @@ def get_logger(name: str) -> logging.Logger:
     return logging.getLogger(name)
 
 
-def get_job_logger(job_id: str) -> logging.Logger:
+# Logger shared by all job threads (see get_job_logger)
+_JOB_LOGGER_NAME = "print_order_web.job"
+
+
+class _JobLoggerAdapter(logging.LoggerAdapter):
+    """Logger adapter that prefixes each message with the job's short ID."""
+
+    def process(self, msg, kwargs):
+        kwargs["extra"] = self.extra
+        return f"[{self.extra['job_id']}] {msg}", kwargs
+
+
+def get_job_logger(job_id: str) -> logging.LoggerAdapter:
     """
     Get a logger for a specific job thread.
 
-    Creates a logger with a name that includes the job ID (truncated),
-    making it easy to filter logs for a specific job.
+    All jobs log through the one "print_order_web.job" logger; the returned
+    adapter adds the job ID (truncated) to each message and to the record
+    as "job_id", making it easy to filter logs for a specific job. No
+    logger is registered per job, so the logging manager does not grow with
+    every submission, and level changes apply to running jobs immediately.
 
     Args:
-        job_id: UUID of the job (only first 8 chars used in name)
+        job_id: UUID of the job (only first 8 chars used)
 
     Returns:
-        Logger instance for the job
+        Logger adapter for the job
 
     Example:
         job_logger = get_job_logger("a1b2c3d4-e5f6-7890-...")
-        # Logger name: "print_order_web.job.a1b2c3d4"
 
         job_logger.info("Job submitted")
-        # Output: 2025-12-03 10:15:30 [INFO] [Job-a1b2c3d4] ... - Job submitted
+        # Output: 2025-12-03 10:15:30 [INFO] [Job-a1b2c3d4] print_order_web.job - [a1b2c3d4] Job submitted
     """
     # Use first 8 characters of job ID for brevity
     short_id = job_id[:8] if len(job_id) >= 8 else job_id
-    return logging.getLogger(f"print_order_web.job.{short_id}")
+    return _JobLoggerAdapter(logging.getLogger(_JOB_LOGGER_NAME), {"job_id": short_id})
 
 
 def set_thread_name(name: str) -> None:
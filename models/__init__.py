@@ -14,7 +14,7 @@ All dataclasses are designed for thread safety:
 
 from .order import Order, OrderChoices, OrderEstimate
 from .job_result import JobResult, LedgerEntry, JobStatus
-from .inventory import InventorySnapshot, TonerBalance, MediaOption
+from .inventory import InventoryHealth, InventorySnapshot, TonerBalance, MediaOption
 
 __all__ = [
     # Order models
@@ -26,6 +26,7 @@ __all__ = [
     "LedgerEntry",
     "JobStatus",
     # Inventory models
+    "InventoryHealth",
     "InventorySnapshot",
     "TonerBalance",
     "MediaOption",
@@ -15,6 +15,7 @@ from __future__ import annotations
 import logging
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from enum import Enum
 from typing import Dict, Any, List, Optional
 
 logger = logging.getLogger(__name__)
@@ -235,6 +236,10 @@ class TonerBalance:
     location: Optional[LocationData] = None
     """Geographic location data (optional - may not be present)."""
 
+    display_name: str = ""
+    """Sidebar display name (projectData "Consumable Name", else title-cased
+    color), resolved once when the snapshot is built."""
+
     @property
     def has_location(self) -> bool:
         """Whether this toner has location data."""
@@ -321,6 +326,23 @@ class MediaOption:
         return result
 
 
+class InventoryHealth(Enum):
+    """
+    Health of an inventory snapshot, as reported by InventorySnapshot.health.
+
+    UNAVAILABLE takes precedence over STALE: an empty snapshot is both.
+    """
+
+    OK = "ok"
+    """Snapshot has data and is fresh."""
+
+    STALE = "stale"
+    """Snapshot has data but is older than the staleness threshold."""
+
+    UNAVAILABLE = "unavailable"
+    """Snapshot has no toner or media data (not fetched yet, or empty)."""
+
+
 @dataclass(frozen=True)
 class InventorySnapshot:
     """
@@ -357,6 +379,51 @@ class InventorySnapshot:
     raw_template: Dict[str, Any] = field(default_factory=dict)
     """Raw template data from API (for job submission)."""
 
+    version: int = 0
+    """Refresh sequence number (0 = empty snapshot). Increases with every
+    snapshot the inventory service publishes, so consumers can cache data
+    derived from a snapshot and rebuild only when the version changes."""
+
+    display_context: Dict[str, Any] = field(default_factory=dict, repr=False)
+    """Prebuilt sidebar template context (printer, inventory, toner/media
+    details), built once by the inventory service when the snapshot is
+    published. Empty if not built. See modules.printer_context."""
+
+    # Raw template account indexes, built in __post_init__ (first match wins)
+    _toner_accounts: Dict[str, Dict[str, Any]] = field(
+        init=False, repr=False, compare=False
+    )
+    _media_accounts: Dict[str, Dict[str, Any]] = field(
+        init=False, repr=False, compare=False
+    )
+    _has_data: bool = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Index raw_template accounts and record whether there is any data."""
+        toner_accounts: Dict[str, Dict[str, Any]] = {}
+        media_accounts: Dict[str, Dict[str, Any]] = {}
+
+        inventory_params = self.raw_template.get("inventoryParameters", {})
+        for wallet in inventory_params.get("wallets", []):
+            for account in wallet.get("accounts", []):
+                # Navigate to UOM to determine type
+                inner_meta = account.get("metadata", {}).get("metadata", {})
+                uom = inner_meta.get("uom", "")
+
+                if uom == "Toner":
+                    project_data = inner_meta.get("tokenDescription", {}).get("projectData", {})
+                    color = project_data.get("Color", "").lower()
+                    toner_accounts.setdefault(color, account)
+                elif uom == "Media":
+                    media_accounts.setdefault(account.get("mintId", ""), account)
+
+        # Frozen dataclass - bypass __setattr__ for the derived fields
+        object.__setattr__(self, "_toner_accounts", toner_accounts)
+        object.__setattr__(self, "_media_accounts", media_accounts)
+        object.__setattr__(
+            self, "_has_data", bool(self.toner_balances or self.media_options)
+        )
+
     @property
     def age_seconds(self) -> float:
         """How old this snapshot is in seconds."""
@@ -368,6 +435,18 @@ class InventorySnapshot:
         """Whether this snapshot is older than 60 seconds."""
         return self.age_seconds > 60.0
 
+    @property
+    def health(self) -> InventoryHealth:
+        """
+        Overall snapshot health, for routes that warn about inventory state.
+
+        Whether the snapshot has data is fixed when it is built; only the
+        staleness check depends on the current time.
+        """
+        if not self._has_data:
+            return InventoryHealth.UNAVAILABLE
+        return InventoryHealth.STALE if self.is_stale else InventoryHealth.OK
+
     def get_toner_by_color(self, color: str) -> Optional[TonerBalance]:
         """
         Find toner balance by color name.
@@ -414,7 +493,7 @@ class InventorySnapshot:
         }
 
     @classmethod
-    def from_template(cls, template: Dict[str, Any]) -> "InventorySnapshot":
+    def from_template(cls, template: Dict[str, Any], version: int = 0) -> "InventorySnapshot":
         """
         Create snapshot from blockchain template response.
 
@@ -423,6 +502,7 @@ class InventorySnapshot:
 
         Args:
             template: Raw template from ld3s_new_job()
+            version: Refresh sequence number assigned by the inventory service
 
         Returns:
             InventorySnapshot with parsed data
@@ -481,6 +561,7 @@ class InventorySnapshot:
                         price=price,
                         tax_rate=tax,
                         location=location,
+                        display_name=project_data.get("Consumable Name", color.title()),
                     )
                     toner_list.append(toner)
 
@@ -511,6 +592,7 @@ class InventorySnapshot:
             toner_balances=tuple(toner_list),
             media_options=tuple(media_list),
             raw_template=template,
+            version=version,
         )
 
     def get_full_account_data(self, account_id: str, consumable_type: str) -> Optional[Dict[str, Any]]:
@@ -527,36 +609,10 @@ class InventorySnapshot:
         Returns:
             Full account dict from raw_template if found, None otherwise
         """
-        if not self.raw_template:
-            return None
-
-        inventory_params = self.raw_template.get("inventoryParameters", {})
-        wallets = inventory_params.get("wallets", [])
-
-        for wallet in wallets:
-            accounts = wallet.get("accounts", [])
-
-            for account in accounts:
-                # Navigate to UOM to determine type
-                outer_meta = account.get("metadata", {})
-                inner_meta = outer_meta.get("metadata", {})
-                uom = inner_meta.get("uom", "")
-
-                if consumable_type == "toner" and uom == "Toner":
-                    # Match by color
-                    token_desc = inner_meta.get("tokenDescription", {})
-                    project_data = token_desc.get("projectData", {})
-                    color = project_data.get("Color", "").lower()
-
-                    if color == account_id.lower():
-                        return account
-
-                elif consumable_type == "media" and uom == "Media":
-                    # Match by mint_id
-                    mint_id = account.get("mintId", "")
-                    if mint_id == account_id:
-                        return account
-
+        if consumable_type == "toner":
+            return self._toner_accounts.get(account_id.lower())
+        if consumable_type == "media":
+            return self._media_accounts.get(account_id)
         return None
 
     @classmethod
@@ -14,7 +14,6 @@ from __future__ import annotations
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
 from typing import Dict, Any, Optional
-from copy import deepcopy
 
 
 @dataclass
@@ -123,13 +122,13 @@ class Order:
     """Original PDF filename."""
 
     stored_filename: str = ""
-    """Unique filename on disk (with timestamp prefix)."""
+    """Unique filename on disk (with epoch-millisecond timestamp prefix)."""
 
     stored_path: str = ""
     """Full path to stored PDF file."""
 
     uploaded_at: str = ""
-    """ISO timestamp of upload."""
+    """Upload time as epoch milliseconds (the stored filename prefix)."""
 
     # PDF analysis (set on upload)
     pages: int = 0
@@ -219,6 +218,11 @@ class Order:
 
         Returns:
             FrozenOrder instance (immutable)
+
+        Note:
+            choices/estimate come from to_dict(), which already builds new
+            containers (the only nested one, toner_usage, is copied), so no
+            deepcopy is needed to detach them from this order.
         """
         return FrozenOrder(
             job_name=self.job_name,
@@ -229,8 +233,8 @@ class Order:
             pages=self.pages,
             width_mm=self.width_mm,
             height_mm=self.height_mm,
-            choices=deepcopy(self.choices.to_dict()) if self.choices else {},
-            estimate=deepcopy(self.estimate.to_dict()) if self.estimate else {},
+            choices=self.choices.to_dict() if self.choices else {},
+            estimate=self.estimate.to_dict() if self.estimate else {},
         )
 
 
@@ -12,6 +12,8 @@ in the future.
 from typing import Dict, List, Any, Optional
 import logging
 
+from models.inventory import LocationData
+
 logger = logging.getLogger(__name__)
 
 
@@ -466,8 +468,6 @@ class ConsumableDetailsExtractor:
         # Extract location data (OPTIONAL - at metadata level, not projectData)
         location_data = metadata.get('locationData')
         if location_data:
-            # Import here to avoid circular imports
-            from models.inventory import LocationData
             location = LocationData.from_api_data(location_data)
             if location.display_name:
                 logger.info(f"  → Extracted origin location: {location.display_name}")
@@ -814,8 +814,6 @@ class ConsumableDetailsExtractor:
         # Extract location data (OPTIONAL - at metadata level, not projectData)
         location_data = metadata.get('locationData')
         if location_data:
-            # Import here to avoid circular imports
-            from models.inventory import LocationData
             location = LocationData.from_api_data(location_data)
             if location.display_name:
                 logger.info(f"  → Extracted media origin location: {location.display_name}")
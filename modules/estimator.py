@@ -65,10 +65,10 @@ class JobEstimator:
         toner_profile = inventory_snapshot["toner_profiles"].get(color_mode, [])
 
         # Debug logging
-        self.logger.debug(f"Estimator inputs: pages={pages}, quantity={quantity}, color_mode={color_mode}, quality={quality}")
-        self.logger.debug(f"Sheets required: {sheets_required}")
-        self.logger.debug(f"Toner profile for {color_mode}: {toner_profile}")
-        self.logger.debug(f"Toner profiles available: {list(inventory_snapshot['toner_profiles'].keys())}")
+        self.logger.debug("Estimator inputs: pages=%s, quantity=%s, color_mode=%s, quality=%s", pages, quantity, color_mode, quality)
+        self.logger.debug("Sheets required: %s", sheets_required)
+        self.logger.debug("Toner profile for %s: %s", color_mode, toner_profile)
+        self.logger.debug("Toner profiles available: %s", list(inventory_snapshot['toner_profiles'].keys()))
 
         # Calculate toner usage with enhanced heuristics
         toner_usage = self._calculate_toner_usage(
@@ -174,7 +174,7 @@ class JobEstimator:
                     # CMY get standard usage
                     toner_usage[color] = round(base_usage_per_color, 2)
 
-        self.logger.debug(f"Toner usage calculated: {toner_usage}")
+        self.logger.debug("Toner usage calculated: %s", toner_usage)
         return toner_usage
 
     def _infer_coverage_type(self, analysis: Dict[str, Any]) -> str:
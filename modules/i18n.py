@@ -18,21 +18,25 @@ Usage in Python:
 import json
 import logging
 from pathlib import Path
-from typing import Dict, Any, Optional
+from types import MappingProxyType
+from typing import Callable, Dict, Any, Mapping, Optional
 
 logger = logging.getLogger(__name__)
 
-# Supported languages
-SUPPORTED_LANGUAGES = {
-    'en': {'name': 'English', 'flag': '🇺🇸', 'flag_emoji': 'US'},
-    'de': {'name': 'Deutsch', 'flag': '🇩🇪', 'flag_emoji': 'DE'},
-}
+# Supported languages (read-only; the same mapping is handed to every render)
+SUPPORTED_LANGUAGES: Mapping[str, Mapping[str, str]] = MappingProxyType({
+    'en': MappingProxyType({'name': 'English', 'flag': '🇺🇸', 'flag_emoji': 'US'}),
+    'de': MappingProxyType({'name': 'Deutsch', 'flag': '🇩🇪', 'flag_emoji': 'DE'}),
+})
 
 DEFAULT_LANGUAGE = 'en'
 
 # Translation cache
 _translations: Dict[str, Dict[str, Any]] = {}
 
+# Template translation filters, one per supported language (see get_translation_filter)
+_translation_filters: Dict[str, Callable[..., str]] = {}
+
 
 class I18nManager:
     """Manages internationalization and translation loading."""
@@ -157,12 +161,12 @@ class I18nManager:
         else:
             return value
 
-    def get_all_languages(self) -> Dict[str, Dict[str, str]]:
+    def get_all_languages(self) -> Mapping[str, Mapping[str, str]]:
         """
         Get all supported languages with metadata.
 
         Returns:
-            Dict mapping language codes to language info
+            Read-only mapping of language codes to language info
         """
         return SUPPORTED_LANGUAGES
 
@@ -206,12 +210,12 @@ def translate(key: str, lang: str = DEFAULT_LANGUAGE, **kwargs) -> str:
     return i18n_manager.get_translation(key, lang, **kwargs)
 
 
-def get_supported_languages() -> Dict[str, Dict[str, str]]:
+def get_supported_languages() -> Mapping[str, Mapping[str, str]]:
     """
     Get all supported languages.
 
     Returns:
-        Dict mapping language codes to language metadata
+        Read-only mapping of language codes to language metadata
     """
     return i18n_manager.get_all_languages()
 
@@ -237,3 +241,25 @@ def create_translation_filter(current_language: str):
         return translate(key, lang=current_language, **kwargs)
 
     return translation_filter
+
+
+def get_translation_filter(current_language: str) -> Callable[..., str]:
+    """
+    Get the shared translation filter for a language.
+
+    Filters are stateless, so one per supported language is created on
+    first use and reused for every request. Unsupported languages get a
+    fresh filter (and are not cached, so the cache stays bounded).
+
+    Args:
+        current_language: Current language code from session
+
+    Returns:
+        Translation filter function
+    """
+    translation_filter = _translation_filters.get(current_language)
+    if translation_filter is None:
+        translation_filter = create_translation_filter(current_language)
+        if current_language in SUPPORTED_LANGUAGES:
+            _translation_filters[current_language] = translation_filter
+    return translation_filter
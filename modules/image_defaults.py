@@ -7,6 +7,8 @@ Organized by consumable type (Toner, Media).
 Edit these SVG definitions to customize the default appearance.
 """
 
+from types import MappingProxyType
+
 # SVG for ALL Toner/Ink consumables (when URL field is missing)
 TONER_DEFAULT_SVG = (
     "data:image/svg+xml,%3Csvg xmlns='http://www.w3.org/2000/svg' "
@@ -43,6 +45,18 @@ GENERIC_DEFAULT_SVG = (
     "%3C/svg%3E"
 )
 
+_DEFAULT_IMAGE_BY_TYPE = {
+    'Toner': TONER_DEFAULT_SVG,
+    'Media': MEDIA_DEFAULT_SVG,
+}
+
+# Template-ready default images ({{ default_images.toner }}). Static, so one
+# read-only mapping is shared by every render instead of rebuilt per request.
+DEFAULT_IMAGES = MappingProxyType({
+    'toner': TONER_DEFAULT_SVG,
+    'media': MEDIA_DEFAULT_SVG,
+})
+
 
 def get_default_image(consumable_type: str) -> str:
     """
@@ -58,9 +72,4 @@ def get_default_image(consumable_type: str) -> str:
         >>> get_default_image('Toner')
         'data:image/svg+xml,...'
     """
-    type_map = {
-        'Toner': TONER_DEFAULT_SVG,
-        'Media': MEDIA_DEFAULT_SVG,
-    }
-
-    return type_map.get(consumable_type, GENERIC_DEFAULT_SVG)
+    return _DEFAULT_IMAGE_BY_TYPE.get(consumable_type, GENERIC_DEFAULT_SVG)
@@ -5,11 +5,13 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Dict, Any
 
-from pypdf import PdfReader
-
 
 class PDFAnalyzer:
-    """Extract minimal metadata, resilient to malformed PDFs."""
+    """Extract minimal metadata, resilient to malformed PDFs.
+
+    pypdf is imported on the first analyze() call rather than at app
+    startup, so cold starts don't pay for it before the first upload.
+    """
 
     def analyze(self, pdf_path: str | Path) -> Dict[str, Any]:
         path = Path(pdf_path)
@@ -21,6 +23,8 @@ class PDFAnalyzer:
             "page_dimensions": [],
         }
 
+        from pypdf import PdfReader
+
         try:
             reader = PdfReader(str(path))
             info["pages"] = len(reader.pages)
@@ -284,6 +284,11 @@ class PrinterConfigManager:
 # Global printer config manager instance
 printer_manager = PrinterConfigManager()
 
+# (inventory key, printer dict) from the last update_printer_from_inventory()
+# call. Only the most recent entry is kept: slot verification mutates the
+# shared printer config, so an older entry would no longer match it.
+_last_printer_update: tuple = (None, None)
+
 
 def get_printer_config() -> Dict[str, Any]:
     """
@@ -306,5 +311,22 @@ def update_printer_from_inventory(inventory_accounts: Dict[str, Any]) -> Dict[st
 
     Returns:
         Updated printer configuration dictionary
+
+    Note:
+        Inventory refreshes usually return unchanged balances, so when the
+        accounts match the previous call the previous result is returned
+        (shared - callers must not mutate it).
     """
-    return printer_manager.update_slot_verification(inventory_accounts).to_dict()
+    global _last_printer_update
+
+    key = tuple(sorted(
+        (color, account.get("available"), account.get("mintId"), account.get("display"))
+        for color, account in inventory_accounts.items()
+    ))
+    last_key, last_printer = _last_printer_update
+    if key == last_key:
+        return last_printer
+
+    printer = printer_manager.update_slot_verification(inventory_accounts).to_dict()
+    _last_printer_update = (key, printer)
+    return printer
@@ -0,0 +1,113 @@
+"""
+Printer Context Builder
+
+Builds the printer and inventory data rendered by the sidebar templates
+from an InventorySnapshot.
+
+This runs on the inventory refresh thread, once per new snapshot, so
+requests only read the prebuilt result (InventorySnapshot.display_context)
+instead of walking the raw template on every render.
+
+Per-request values are NOT included; with_render_values() overlays them:
+- inventory["is_stale"] (depends on the snapshot's age at render time)
+- default_images
+"""
+
+from typing import Any, Dict
+import logging
+
+from models.inventory import InventorySnapshot
+from modules.consumable_details import get_consumable_details
+from modules.image_defaults import DEFAULT_IMAGES
+from modules.printer_config import get_printer_config, update_printer_from_inventory
+
+logger = logging.getLogger(__name__)
+
+# Printer config as loaded, before the inventory thread has verified any
+# slots. Fallback sidebars (no inventory yet, or an error) show it; it is
+# built once at import so those renders share it. Callers must not mutate it.
+UNVERIFIED_PRINTER: Dict[str, Any] = get_printer_config()
+
+
+def build_printer_context(snapshot: InventorySnapshot) -> Dict[str, Any]:
+    """
+    Build printer/inventory template context for a snapshot.
+
+    Args:
+        snapshot: Inventory snapshot to build from
+
+    Returns:
+        Dict with printer, inventory, toner_details, media_details and
+        unattached_consumables keys
+    """
+    toner_dict: Dict[str, Any] = {}
+    media_dict: Dict[str, Any] = {}
+    toner_details: Dict[str, Any] = {}
+    media_details: Dict[str, Any] = {}
+
+    # Build inventory dict (for compatibility with existing code). It holds
+    # the balance dicts by reference, so they can be filled in below in the
+    # same pass that extracts consumable details.
+    inventory = {
+        "toner_balances": toner_dict,
+        "media_options": media_dict,
+        "toner_profiles": {
+            "full_color": ["cyan", "magenta", "yellow", "black"],
+            "mono": ["black"],
+        },
+        "default_turnaround_options": ["standard", "rush", "economy"],
+    }
+
+    # One pass per consumable type: display names are resolved on the
+    # snapshot models, and each account is looked up once for its details
+    for toner in snapshot.toner_balances:
+        toner_dict[toner.color] = {
+            "available": toner.balance_ml,
+            "mintId": toner.mint_id,
+            "display": toner.display_name or toner.color.title(),
+        }
+        account = snapshot.get_full_account_data(toner.color, "toner")
+        if account:
+            toner_details[toner.color] = get_consumable_details("toner", account, inventory)
+
+    for media in snapshot.media_options:
+        media_dict[media.mint_id] = {
+            "available": media.balance_sheets,
+            "display": media.display_name,
+        }
+        account = snapshot.get_full_account_data(media.mint_id, "media")
+        if account:
+            media_details[media.mint_id] = get_consumable_details("media", account, inventory)
+
+    printer = update_printer_from_inventory(toner_dict)
+
+    return {
+        "printer": printer,
+        "inventory": inventory,
+        "toner_details": toner_details,
+        "media_details": media_details,
+        "unattached_consumables": [],
+    }
+
+
+def with_render_values(display_context: Dict[str, Any], is_stale: bool) -> Dict[str, Any]:
+    """
+    Overlay per-render values on a prebuilt display context.
+
+    The prebuilt context is shared between requests and is not modified;
+    only the top level and the inventory dict are copied.
+
+    Args:
+        display_context: Result of build_printer_context()
+        is_stale: Whether the snapshot is stale at render time
+
+    Returns:
+        Template context for the sidebar
+    """
+    context = dict(display_context)
+    context["inventory"] = {
+        **display_context["inventory"],
+        "is_stale": is_stale,
+    }
+    context["default_images"] = DEFAULT_IMAGES
+    return context
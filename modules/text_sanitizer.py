@@ -0,0 +1,54 @@
+"""
+User Text Sanitizer
+
+Cleans free-text form fields (job name, notes) before they are stored in
+the order and shown on later pages.
+
+Control characters (other than tab, newline and carriage return) are
+deleted up front with str.translate. Most remaining input is plain text
+with nothing for bleach to change, so bleach (and its html5lib tokenizer)
+only runs when the text contains a character it would rewrite: markup
+(<, >, &) or a carriage return. For any other text its output equals its
+input, so the result is the same either way.
+"""
+
+import re
+from typing import Optional
+
+# C0 controls except tab, newline and carriage return, plus DEL: deleted
+_CONTROL_CHARS = dict.fromkeys(
+    [*range(0x00, 0x09), 0x0b, 0x0c, *range(0x0e, 0x20), 0x7f]
+)
+
+# Characters bleach.clean(tags=[], strip=True) still changes once the control
+# characters are gone: carriage returns and the HTML-significant &, < and >
+_NEEDS_BLEACH = re.compile(r"[\r&<>]")
+
+
+def sanitize_text(text: str, max_length: Optional[int] = None) -> str:
+    """
+    Sanitize user input text to prevent XSS and injection attacks.
+
+    Args:
+        text: Raw input text
+        max_length: Optional maximum length to enforce
+
+    Returns:
+        Sanitized text safe for storage and display
+    """
+    if not text:
+        return ""
+
+    # Drop control characters and strip whitespace
+    text = text.translate(_CONTROL_CHARS).strip()
+
+    # Bleach HTML tags and attributes (only if there is anything to clean)
+    if _NEEDS_BLEACH.search(text):
+        import bleach
+        text = bleach.clean(text, tags=[], strip=True)
+
+    # Truncate if needed
+    if max_length and len(text) > max_length:
+        text = text[:max_length]
+
+    return text
@@ -89,6 +89,8 @@ a = Analysis(
         'pypdf',
         'dotenv',
         'bleach',
+        'orjson',
+        'simdjson',
         'logging.handlers',
 
         # Application configuration
@@ -111,6 +113,7 @@ a = Analysis(
         'services',
         'services.inventory_service',
         'services.job_service',
+        'services.order_store',
 
         # Routes (new architecture)
         'routes',
@@ -121,6 +124,8 @@ a = Analysis(
         'routes.submit',
         'routes.confirmation',
         'routes.api',
+        'routes.order_session',
+        'routes.urls',
 
         # Helper modules
         'modules',
@@ -128,8 +133,10 @@ a = Analysis(
         'modules.pdf_analyzer',
         'modules.i18n',
         'modules.printer_config',
+        'modules.printer_context',
         'modules.consumable_details',
         'modules.image_defaults',
+        'modules.text_sanitizer',
 
         # Reverse geocoder for location data feature
         'reverse_geocoder',
@@ -9,6 +9,7 @@ This module contains all route handlers organized by functionality:
 - submit: Job submission
 - confirmation: Results display
 - api: AJAX endpoints (sidebar refresh, status polling)
+- urls: Pre-resolved redirect targets (redirect_to)
 
 Each blueprint is registered with the Flask app in create_app().
 """
@@ -22,6 +23,7 @@ from .review import review_bp
 from .submit import submit_bp
 from .confirmation import confirmation_bp
 from .api import api_bp
+from .urls import resolve_route_urls
 
 __all__ = [
     "main_bp",
@@ -38,6 +40,8 @@ def register_blueprints(app):
     """
     Register all blueprints with the Flask app.
 
+    Also resolves the redirect targets into app.config["ROUTE_URLS"].
+
     Args:
         app: Flask application instance
     """
@@ -48,3 +52,5 @@ def register_blueprints(app):
     app.register_blueprint(submit_bp)
     app.register_blueprint(confirmation_bp)
     app.register_blueprint(api_bp)
+
+    app.config["ROUTE_URLS"] = resolve_route_urls(app)
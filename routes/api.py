@@ -7,14 +7,26 @@ Handles:
 - /health - Health check endpoint
 """
 
+import hashlib
+import json
+import threading
+from typing import Set, Tuple
+
 from flask import (
     Blueprint,
     current_app,
+    make_response,
     render_template,
+    request,
     session,
 )
 
+from models.inventory import InventoryHealth
 from models.job_result import JobStatus
+from modules.i18n import DEFAULT_LANGUAGE
+from modules.image_defaults import DEFAULT_IMAGES
+from modules.printer_context import UNVERIFIED_PRINTER, with_render_values
+from routes.order_session import get_order
 from logging_config import get_logger
 
 
@@ -23,6 +35,29 @@ logger = get_logger(__name__)
 
 api_bp = Blueprint("api", __name__)
 
+# Rendered sidebar HTML for the current snapshot, keyed by (is_stale, language),
+# as (html, etag) pairs. The sidebar only changes when the inventory service
+# publishes a new snapshot, so polls in between are served from here. Matching
+# on the snapshot object itself (not its version) keeps apps with separate
+# inventory services from sharing entries.
+_sidebar_cache = {"snapshot": None, "pages": {}}
+_sidebar_cache_lock = threading.Lock()
+
+# /status body while a job is still running. This is the answer to almost
+# every poll, and it never changes, so it is serialized once.
+_PROCESSING_STATUS_JSON = json.dumps({
+    "status": "processing",
+    "progress": 50,
+    "message": "Submitting job to blockchain...",
+    "complete": False,
+    "error": False
+}, separators=(",", ":"))
+
+# (message, exception type) pairs whose traceback a polling endpoint has
+# already logged. Polls repeat every few seconds, so a persistent failure
+# logs its traceback once and a one-line error on every later poll.
+_logged_poll_errors: Set[Tuple[str, type]] = set()
+
 
 @api_bp.route("/api/sidebar_refresh", methods=["GET"])
 def sidebar_refresh():
@@ -32,7 +67,8 @@ def sidebar_refresh():
     Returns the sidebar HTML partial with fresh inventory data.
     Called periodically by JavaScript to keep sidebar up-to-date.
 
-    This uses the INVENTORY SERVICE's cached data (refreshed every 30s).
+    This uses the INVENTORY SERVICE's cached data (refreshed every 30s),
+    including the display context prebuilt with each snapshot.
     It is COMPLETELY SEPARATE from job submission data.
     """
     try:
@@ -45,112 +81,84 @@ def sidebar_refresh():
         snapshot = inventory_service.get_snapshot()
 
         # Check if data is available
-        if not snapshot.toner_balances and not snapshot.media_options:
+        if snapshot.health is InventoryHealth.UNAVAILABLE:
             return _render_error_sidebar("Inventory not yet loaded")
 
-        # Get helper modules
-        printer_config_module = current_app.config.get("PRINTER_CONFIG_MODULE")
-        consumable_details_module = current_app.config.get("CONSUMABLE_DETAILS_MODULE")
-        image_defaults_module = current_app.config.get("IMAGE_DEFAULTS_MODULE")
-
-        # Build toner dict with display names from raw_template
-        toner_dict = {}
-        for t in snapshot.toner_balances:
-            display_name = t.color.title()  # Default fallback
-            account = snapshot.get_full_account_data(t.color, "toner")
-            if account:
-                outer_meta = account.get("metadata", {})
-                inner_meta = outer_meta.get("metadata", {})
-                token_desc = inner_meta.get("tokenDescription", {})
-                project_data = token_desc.get("projectData", {})
-                display_name = project_data.get("Consumable Name", display_name)
-
-            toner_dict[t.color] = {
-                "available": t.balance_ml,
-                "mintId": t.mint_id,
-                "display": display_name,
-            }
-
-        # Build printer config
-        if printer_config_module:
-            printer = printer_config_module.update_printer_from_inventory(toner_dict)
-        else:
-            printer = {"slots": []}
-
-        # Build media dict with display names
-        media_dict = {}
-        for m in snapshot.media_options:
-            display_name = m.display_name
-            account = snapshot.get_full_account_data(m.mint_id, "media")
-            if account:
-                outer_meta = account.get("metadata", {})
-                inner_meta = outer_meta.get("metadata", {})
-                token_desc = inner_meta.get("tokenDescription", {})
-                project_data = token_desc.get("projectData", {})
-                display_name = project_data.get("Consumable Name", display_name)
-
-            media_dict[m.mint_id] = {
-                "available": m.balance_sheets,
-                "display": display_name,
-            }
-
-        # Build inventory dict for templates
-        inventory = {
-            "toner_balances": toner_dict,
-            "media_options": media_dict,
-            "is_stale": snapshot.is_stale,
-            "toner_profiles": {
-                "full_color": ["cyan", "magenta", "yellow", "black"],
-                "mono": ["black"],
-            },
-            "default_turnaround_options": ["standard", "rush", "economy"],
-        }
+        # The inventory thread builds the sidebar data (printer, balances and
+        # consumable details) once per snapshot; only per-render values are
+        # added here
+        display_context = snapshot.display_context
+        if not display_context:
+            return _render_error_sidebar("Inventory display unavailable")
 
-        # Extract consumable details from raw_template for sidebar display
-        toner_details = {}
-        media_details = {}
-        if consumable_details_module:
-            for toner in snapshot.toner_balances:
-                account = snapshot.get_full_account_data(toner.color, "toner")
-                if account:
-                    toner_details[toner.color] = consumable_details_module.get_consumable_details(
-                        "toner", account, inventory
-                    )
-
-            for media in snapshot.media_options:
-                account = snapshot.get_full_account_data(media.mint_id, "media")
-                if account:
-                    media_details[media.mint_id] = consumable_details_module.get_consumable_details(
-                        "media", account, inventory
-                    )
-
-        # Get default images
-        default_images = {
-            'toner': '/static/images/default_toner.svg',
-            'media': '/static/images/default_media.svg',
-        }
-        if image_defaults_module:
-            default_images = {
-                'toner': image_defaults_module.get_default_image('Toner'),
-                'media': image_defaults_module.get_default_image('Media'),
-            }
+        html, etag = _get_sidebar_page(snapshot, display_context)
 
-        # Render sidebar partial
-        return render_template(
-            "partials/authenticated_sidebar.html",
-            printer=printer,
-            inventory=inventory,
-            toner_details=toner_details,
-            media_details=media_details,
-            unattached_consumables=[],
-            default_images=default_images
-        )
+        # Content-based ETag: the browser revalidates each poll and gets a
+        # 304 without a body while the sidebar is unchanged
+        response = make_response(html)
+        response.set_etag(etag)
+        response.headers["Cache-Control"] = "no-cache"
+        return response.make_conditional(request)
 
     except Exception as e:
-        logger.error(f"Sidebar refresh failed: {e}", exc_info=True)
+        _log_poll_error("Sidebar refresh failed", e)
         return _render_error_sidebar(f"Refresh failed: {str(e)}")
 
 
+def _log_poll_error(message: str, error: Exception) -> None:
+    """
+    Log a polling endpoint failure, with a traceback only the first time.
+
+    Args:
+        message: What failed (also part of the once-only key)
+        error: The exception being handled
+    """
+    key = (message, type(error))
+    first_time = key not in _logged_poll_errors
+    if first_time:
+        _logged_poll_errors.add(key)
+
+    logger.error(
+        "%s: %s: %s", message, type(error).__name__, error, exc_info=first_time
+    )
+
+
+def _get_sidebar_page(snapshot, display_context) -> Tuple[str, str]:
+    """
+    Get the rendered sidebar for a snapshot, rendering it on first request.
+
+    Args:
+        snapshot: Current inventory snapshot
+        display_context: The snapshot's prebuilt display context
+
+    Returns:
+        Tuple of (html, etag)
+    """
+    is_stale = snapshot.is_stale
+    key = (is_stale, session.get("language", DEFAULT_LANGUAGE))
+
+    with _sidebar_cache_lock:
+        if _sidebar_cache["snapshot"] is snapshot:
+            page = _sidebar_cache["pages"].get(key)
+            if page is not None:
+                return page
+
+    html = render_template(
+        "partials/authenticated_sidebar.html",
+        **with_render_values(display_context, is_stale)
+    )
+    page = (html, hashlib.sha1(html.encode("utf-8")).hexdigest())
+
+    with _sidebar_cache_lock:
+        if _sidebar_cache["snapshot"] is not snapshot:
+            # New snapshot - drop pages rendered from the previous one
+            _sidebar_cache["snapshot"] = snapshot
+            _sidebar_cache["pages"] = {}
+        _sidebar_cache["pages"][key] = page
+
+    return page
+
+
 @api_bp.route("/status", methods=["GET"])
 def status():
     """
@@ -160,7 +168,7 @@ def status():
     Returns JSON with current progress and status information.
     """
     job_id = session.get("job_id")
-    order = session.get("order")
+    order = get_order()
 
     if not job_id or not order:
         return {
@@ -188,15 +196,14 @@ def status():
 
         if result:
             # Job thread has completed and stored result
-            logger.info(f"Job {job_id[:8]} completed: {result.status.value}")
+            logger.info("Job %s completed: %s", job_id[:8], result.status.value)
 
-            # Convert JobResult to dict for session storage
+            # Convert JobResult to dict for order storage
             result_dict = result.to_dict()
 
-            # Store result in session
+            # Store result on the order
             order["result"] = result_dict
-            session.modified = True
-            logger.info(f"Result stored in session")
+            logger.info("Result stored on order")
 
             # Determine if error
             is_error = (
@@ -204,6 +211,13 @@ def status():
                 not result.transaction_success
             )
 
+            # A successful job spent consumables - refresh the sidebar
+            # balances now rather than at the next scheduled refresh
+            if not is_error:
+                inventory_service = current_app.config.get("INVENTORY_SERVICE")
+                if inventory_service:
+                    inventory_service.request_refresh(force=True)
+
             return {
                 "status": result.status.value,
                 "progress": 100,
@@ -215,13 +229,9 @@ def status():
 
         # Check if job is still processing
         if job_service.is_job_pending(job_id):
-            return {
-                "status": "processing",
-                "progress": 50,
-                "message": "Submitting job to blockchain...",
-                "complete": False,
-                "error": False
-            }
+            return current_app.response_class(
+                _PROCESSING_STATUS_JSON, mimetype="application/json"
+            )
 
         # Job not found in pending or results - might have expired
         return {
@@ -233,7 +243,7 @@ def status():
         }
 
     except Exception as e:
-        logger.error(f"Status check failed: {e}", exc_info=True)
+        _log_poll_error("Status check failed", e)
         return {
             "status": "error",
             "progress": 0,
@@ -264,10 +274,7 @@ def health():
     inventory_service = current_app.config.get("INVENTORY_SERVICE")
     if inventory_service and inventory_service.is_running:
         snapshot = inventory_service.get_snapshot()
-        if snapshot.is_stale:
-            health_status["checks"]["inventory"] = "stale"
-        else:
-            health_status["checks"]["inventory"] = "ok"
+        health_status["checks"]["inventory"] = snapshot.health.value
     else:
         health_status["checks"]["inventory"] = "not_running"
         health_status["status"] = "degraded"
@@ -286,38 +293,9 @@ def health():
 
 def _render_error_sidebar(error_message: str):
     """Render sidebar with error state."""
-    # Get proper printer config (with unverified_count and other required fields)
-    printer_config_module = current_app.config.get("PRINTER_CONFIG_MODULE")
-    if printer_config_module:
-        printer = printer_config_module.get_printer_config()
-    else:
-        # Fallback with all required template fields
-        printer = {
-            "slots": [],
-            "unverified_count": 0,
-            "verified_count": 0,
-            "total_slots": 0,
-            "model_name": "Unknown",
-            "description": "",
-            "ink_set_name": "",
-            "model_code": "",
-        }
-
-    image_defaults_module = current_app.config.get("IMAGE_DEFAULTS_MODULE")
-    if image_defaults_module:
-        default_images = {
-            'toner': image_defaults_module.get_default_image('Toner'),
-            'media': image_defaults_module.get_default_image('Media'),
-        }
-    else:
-        default_images = {
-            'toner': '/static/images/default_toner.svg',
-            'media': '/static/images/default_media.svg',
-        }
-
     return render_template(
         "partials/authenticated_sidebar.html",
-        printer=printer,
+        printer=UNVERIFIED_PRINTER,
         inventory={
             "error": error_message,
             "api_unavailable": True,
@@ -327,7 +305,7 @@ def _render_error_sidebar(error_message: str):
         toner_details={},
         media_details={},
         unattached_consumables=[],
-        default_images=default_images
+        default_images=DEFAULT_IMAGES
     )
 
 
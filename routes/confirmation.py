@@ -8,13 +8,13 @@ from flask import (
     Blueprint,
     current_app,
     flash,
-    redirect,
     render_template,
     session,
-    url_for,
 )
 
 from logging_config import get_logger
+from routes.order_session import clear_order, get_order
+from routes.urls import redirect_to
 
 
 # Module logger
@@ -30,11 +30,11 @@ def confirmation():
 
     Shows result of job submission (success or failure).
     """
-    order = session.get("order")
+    order = get_order()
 
     if not order or "result" not in order:
         flash("Submit an order to see the confirmation page.", "warning")
-        return redirect(url_for("upload.upload"))
+        return redirect_to("upload.upload")
 
     return render_template("confirmation.html", order=order)
 
@@ -44,19 +44,20 @@ def start_over():
     """
     Clear session and start a new order.
 
-    Force cache refresh to ensure user sees latest consumables
-    when starting a new order.
+    Requests an inventory refresh so the user sees the latest consumables
+    when starting a new order. The refresh runs on the inventory thread;
+    this request does not wait for it.
     """
     # Clear order from session
-    session.pop("order", None)
+    clear_order()
     session.pop("job_id", None)
     session.pop("job_start_time", None)
 
-    # Force inventory refresh (if available)
+    # Request inventory refresh (if available)
     inventory_service = current_app.config.get("INVENTORY_SERVICE")
     if inventory_service:
-        inventory_service.force_refresh()
-        logger.info("Inventory refresh triggered for new order")
+        inventory_service.request_refresh(force=True)
+        logger.info("Inventory refresh requested for new order")
 
     flash("Session cleared. Start a new order.", "success")
-    return redirect(url_for("upload.upload"))
+    return redirect_to("upload.upload")
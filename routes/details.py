@@ -5,19 +5,19 @@ Handles job configuration: quantity, media, quality, etc.
 Generates consumption estimates and validates against inventory.
 """
 
-import bleach
 from flask import (
     Blueprint,
     current_app,
     flash,
-    redirect,
     render_template,
     request,
-    session,
-    url_for,
 )
 
 from logging_config import get_logger
+from models.inventory import InventoryHealth
+from modules.text_sanitizer import sanitize_text
+from routes.order_session import get_order
+from routes.urls import redirect_to
 
 
 # Module logger
@@ -28,17 +28,17 @@ details_bp = Blueprint("details", __name__)
 # Constants
 MAX_NOTES_LENGTH = 1000
 MAX_QUANTITY = 10000
+VALID_QUALITIES = frozenset({"draft", "standard", "high"})
 
-
-def _sanitize_text(text: str, max_length: int = None) -> str:
-    """Sanitize user input text."""
-    if not text:
-        return ""
-    text = text.strip()
-    text = bleach.clean(text, tags=[], strip=True)
-    if max_length and len(text) > max_length:
-        text = text[:max_length]
-    return text
+# Flash shown for each unhealthy inventory state (healthy: nothing)
+_HEALTH_WARNINGS = {
+    InventoryHealth.STALE: (
+        "Inventory data may be outdated. Please verify availability.", "warning"
+    ),
+    InventoryHealth.UNAVAILABLE: (
+        "Inventory data is not available yet. Please try again shortly.", "warning"
+    ),
+}
 
 
 @details_bp.route("/details", methods=["GET", "POST"])
@@ -49,10 +49,10 @@ def details():
     GET: Display job details form with current inventory
     POST: Validate choices, generate estimate, redirect to review
     """
-    order = session.get("order")
+    order = get_order()
     if not order:
         flash("Please upload a PDF before filling in job details.", "warning")
-        return redirect(url_for("upload.upload"))
+        return redirect_to("upload.upload")
 
     # Get services from app context
     inventory_service = current_app.config.get("INVENTORY_SERVICE")
@@ -60,57 +60,64 @@ def details():
 
     if not inventory_service:
         flash("Inventory service unavailable. Please try again later.", "error")
-        return redirect(url_for("upload.upload"))
+        return redirect_to("upload.upload")
 
     # Get inventory snapshot (for display)
     # Note: This is from the SIDEBAR inventory thread, completely separate from job submission
     snapshot = inventory_service.get_snapshot()
 
-    # Check if inventory is ready
-    if snapshot.is_stale:
-        flash("Inventory data may be outdated. Please verify availability.", "warning")
+    # Check if inventory is ready (one health read covers stale and empty)
+    health = snapshot.health
+    # A POST without inventory gets the "cannot proceed" error below instead
+    if health is not InventoryHealth.OK and not (
+        request.method == "POST" and health is InventoryHealth.UNAVAILABLE
+    ):
+        flash(*_HEALTH_WARNINGS[health])
 
     # Convert snapshot to template-compatible format
     # (maintains compatibility with existing templates)
     inventory = _snapshot_to_inventory_dict(snapshot)
 
     if request.method == "POST":
+        form = request.form
+        # Page count from analysis (an empty or 0-page result counts as one)
+        pages = order.get("analysis", {}).get("pages", 1) or 1
+
         try:
             # Block submission if no inventory data
-            if not snapshot.toner_balances and not snapshot.media_options:
+            if health is InventoryHealth.UNAVAILABLE:
                 flash("Cannot proceed - inventory system is unavailable.", "error")
-                return redirect(url_for("details.details"))
+                return redirect_to("details.details")
 
             # Parse and validate quantity
             try:
-                quantity = int(request.form.get("quantity", "0"))
+                quantity = int(form.get("quantity", "0"))
             except ValueError:
                 flash("Invalid quantity. Please enter a valid number.", "error")
-                return redirect(url_for("details.details"))
+                return redirect_to("details.details")
 
             if quantity <= 0:
                 flash("Quantity must be greater than zero.", "error")
-                return redirect(url_for("details.details"))
+                return redirect_to("details.details")
 
             if quantity > MAX_QUANTITY:
                 flash(f"Quantity too large. Maximum is {MAX_QUANTITY} copies.", "error")
-                return redirect(url_for("details.details"))
+                return redirect_to("details.details")
 
             # Get and validate selections
-            color_mode = request.form.get("color_mode")
-            media_type = request.form.get("media_type")
-            turnaround = request.form.get("turnaround_time", "standard")
-            quality = request.form.get("quality", "standard")
+            color_mode = form.get("color_mode")
+            media_type = form.get("media_type")
+            turnaround = form.get("turnaround_time", "standard")
+            quality = form.get("quality", "standard")
 
             # Validate quality parameter
-            valid_qualities = ["draft", "standard", "high"]
-            if quality not in valid_qualities:
-                logger.warning(f"Invalid quality value: {quality}, defaulting to standard")
+            if quality not in VALID_QUALITIES:
+                logger.warning("Invalid quality value: %s, defaulting to standard", quality)
                 quality = "standard"
 
             # Sanitize notes input
-            notes = _sanitize_text(
-                request.form.get("notes", ""),
+            notes = sanitize_text(
+                form.get("notes", ""),
                 max_length=MAX_NOTES_LENGTH
             )
 
@@ -118,37 +125,27 @@ def details():
             media_option = snapshot.get_media_by_mint_id(media_type)
             if not media_option:
                 flash("Selected media type is not available.", "error")
-                return redirect(url_for("details.details"))
+                return redirect_to("details.details")
 
             # Validation: Media availability
-            pages = order.get("analysis", {}).get("pages", 1)
             sheets_needed = quantity * pages
-            if media_option.balance_sheets < sheets_needed:
-                max_qty = int(media_option.balance_sheets // pages)
+            available_sheets = media_option.balance_sheets
+            if available_sheets < sheets_needed:
+                max_qty = int(available_sheets // pages)
                 flash(
                     f"Insufficient media. Need {sheets_needed} sheets but only "
-                    f"{media_option.balance_sheets:.0f} available. "
+                    f"{available_sheets:.0f} available. "
                     f"Please reduce quantity to {max_qty} or less.",
                     "error"
                 )
-                return redirect(url_for("details.details"))
-
-            # Get accurate display name from raw_template
-            media_display_name = media_option.display_name  # Default from model
-            account = snapshot.get_full_account_data(media_type, "media")
-            if account:
-                outer_meta = account.get("metadata", {})
-                inner_meta = outer_meta.get("metadata", {})
-                token_desc = inner_meta.get("tokenDescription", {})
-                project_data = token_desc.get("projectData", {})
-                media_display_name = project_data.get("Consumable Name") or media_display_name
+                return redirect_to("details.details")
 
             # Create choices dict
             choices = {
                 "quantity": quantity,
                 "color_mode": color_mode,
                 "media_type": media_type,
-                "media_display_name": media_display_name,
+                "media_display_name": media_option.display_name,
                 "turnaround_time": turnaround,
                 "quality": quality,
                 "notes": notes,
@@ -159,9 +156,9 @@ def details():
 
             # Generate estimate
             if estimator:
-                logger.debug(f"Generating estimate for {quantity} copies, {color_mode} mode")
+                logger.debug("Generating estimate for %s copies, %s mode", quantity, color_mode)
                 estimate = estimator.estimate(order, inventory)
-                logger.debug(f"Estimate generated: {estimate}")
+                logger.debug("Estimate generated: %s", estimate)
 
                 # Validation: Toner availability
                 for color, required_ml in estimate.get("toner_usage", {}).items():
@@ -172,7 +169,7 @@ def details():
                             f"but only {toner.balance_ml:.1f} mL available.",
                             "error"
                         )
-                        return redirect(url_for("details.details"))
+                        return redirect_to("details.details")
 
                 order["estimate"] = estimate
             else:
@@ -183,15 +180,13 @@ def details():
                     "estimated_cost": 0.0,
                 }
 
-            session.modified = True
-
-            logger.info(f"Order details saved: {quantity} copies, {color_mode}, {sheets_needed} sheets")
-            return redirect(url_for("review.review"))
+            logger.info("Order details saved: %s copies, %s, %s sheets", quantity, color_mode, sheets_needed)
+            return redirect_to("review.review")
 
         except Exception as e:
-            logger.error(f"Error processing details form: {e}", exc_info=True)
+            logger.error("Error processing details form: %s", e, exc_info=True)
             flash(f"Failed to process job details: {str(e)}", "error")
-            return redirect(url_for("details.details"))
+            return redirect_to("details.details")
 
     # GET request - display details form
     return render_template(
@@ -216,23 +211,13 @@ def _snapshot_to_inventory_dict(snapshot) -> dict:
             "slot_number": toner.slot_number,
         }
 
-    # Build media options dict with display names from raw_template
+    # Build media options dict. The model's display_name is already resolved
+    # from projectData ("Consumable Name", then "ProductName", then mint ID).
     media_options = {}
     for media in snapshot.media_options:
-        # Get display name from raw_template for accurate display
-        display_name = media.display_name  # Default from model
-        account = snapshot.get_full_account_data(media.mint_id, "media")
-        if account:
-            outer_meta = account.get("metadata", {})
-            inner_meta = outer_meta.get("metadata", {})
-            token_desc = inner_meta.get("tokenDescription", {})
-            project_data = token_desc.get("projectData", {})
-            # Try "Consumable Name" first (real API), then use model's display_name
-            display_name = project_data.get("Consumable Name") or display_name
-
         media_options[media.mint_id] = {
             "available": media.balance_sheets,
-            "display": display_name,
+            "display": media.display_name,
             "width_mm": media.width_mm,
             "height_mm": media.height_mm,
         }
@@ -4,7 +4,9 @@ Main routes (home, demo).
 Simple landing pages and redirects.
 """
 
-from flask import Blueprint, redirect, render_template, url_for
+from flask import Blueprint, render_template
+
+from routes.urls import redirect_to
 
 main_bp = Blueprint("main", __name__)
 
@@ -12,7 +14,7 @@ main_bp = Blueprint("main", __name__)
 @main_bp.route("/")
 def index():
     """Redirect root to demo page (home page)."""
-    return redirect(url_for("main.demo"))
+    return redirect_to("main.demo")
 
 
 @main_bp.route("/demo", methods=["GET"])
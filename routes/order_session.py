@@ -0,0 +1,42 @@
+"""
+Order access helpers for routes.
+
+The session cookie only holds "order_id"; the order itself lives in the
+OrderStore at app.config["ORDER_STORE"]. Order dicts returned here are the
+stored objects, so changes to them are kept without touching the session.
+"""
+
+from typing import Any, Dict, Optional
+
+from flask import current_app, session
+
+
+def get_order() -> Optional[Dict[str, Any]]:
+    """
+    Get the current session's order.
+
+    Returns:
+        Order dict, or None if the session has no (live) order
+    """
+    return current_app.config["ORDER_STORE"].get(session.get("order_id"))
+
+
+def new_order() -> Dict[str, Any]:
+    """
+    Start a new, empty order for the current session.
+
+    Any previous order of this session is discarded.
+
+    Returns:
+        The new order dict
+    """
+    store = current_app.config["ORDER_STORE"]
+    store.discard(session.get("order_id"))
+    order_id, order = store.create()
+    session["order_id"] = order_id
+    return order
+
+
+def clear_order() -> None:
+    """Discard the current session's order and forget its ID."""
+    current_app.config["ORDER_STORE"].discard(session.pop("order_id", None))
@@ -7,12 +7,12 @@ Displays order summary before submission.
 from flask import (
     Blueprint,
     flash,
-    redirect,
     render_template,
-    session,
-    url_for,
 )
 
+from routes.order_session import get_order
+from routes.urls import redirect_to
+
 
 review_bp = Blueprint("review", __name__)
 
@@ -24,11 +24,11 @@ def review():
 
     Shows all order details and estimate before submission.
     """
-    order = session.get("order")
+    order = get_order()
 
     # Ensure we have complete order data
     if not order or "choices" not in order:
         flash("Please complete job details before review.", "warning")
-        return redirect(url_for("details.details"))
+        return redirect_to("details.details")
 
     return render_template("review.html", order=order)
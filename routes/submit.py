@@ -6,18 +6,20 @@ Creates a FROZEN order snapshot and spawns a job thread.
 The job thread is COMPLETELY ISOLATED from inventory.
 """
 
+import time
 from datetime import datetime
 
 from flask import (
     Blueprint,
     current_app,
     flash,
-    redirect,
+    render_template,
     session,
-    url_for,
 )
 
 from models.order import Order
+from routes.order_session import get_order
+from routes.urls import redirect_to
 from logging_config import get_logger
 
 
@@ -43,22 +45,22 @@ def submit():
 
     NO SHARED STATE between inventory and job submission.
     """
-    order_dict = session.get("order")
+    order_dict = get_order()
 
     # Validation
     if not order_dict or "choices" not in order_dict:
         flash("Please complete job details before submitting.", "error")
-        return redirect(url_for("details.details"))
+        return redirect_to("details.details")
 
     try:
         job_name = order_dict.get('job_name', 'Unknown Job')
-        logger.info(f"Starting job submission for: {job_name}")
+        logger.info("Starting job submission for: %s", job_name)
 
         # Get job service from app context
         job_service = current_app.config.get("JOB_SERVICE")
         if not job_service:
             flash("Job service unavailable. Please try again later.", "error")
-            return redirect(url_for("review.review"))
+            return redirect_to("review.review")
 
         # STEP 1: Convert session dict to Order object
         order = Order.from_dict(order_dict)
@@ -68,11 +70,11 @@ def submit():
         # It cannot be modified, ensuring complete isolation
         frozen_order = order.freeze()
 
-        logger.info(f"Created frozen order: {frozen_order.job_name}")
-        logger.debug(f"  Quantity: {frozen_order.quantity}")
-        logger.debug(f"  Media: {frozen_order.media_type}")
-        logger.debug(f"  Sheets: {frozen_order.sheets_required}")
-        logger.debug(f"  Toner: {frozen_order.toner_usage}")
+        logger.info("Created frozen order: %s", frozen_order.job_name)
+        logger.debug("  Quantity: %s", frozen_order.quantity)
+        logger.debug("  Media: %s", frozen_order.media_type)
+        logger.debug("  Sheets: %s", frozen_order.sheets_required)
+        logger.debug("  Toner: %s", frozen_order.toner_usage)
 
         # STEP 3: Submit to job service (spawns thread)
         # The job thread will:
@@ -83,21 +85,21 @@ def submit():
         # - Store result in JobResultStore
         job_id = job_service.submit_job(frozen_order)
 
-        logger.info(f"Job submitted: {job_id}")
+        logger.info("Job submitted: %s", job_id)
 
         # STEP 4: Store job ID in session for status polling
         session["job_id"] = job_id
-        session["job_start_time"] = datetime.utcnow().isoformat()
+        session["job_start_time"] = time.time()
         session.modified = True
 
         # Redirect to processing page for AJAX polling
-        return redirect(url_for("submit.processing"))
+        return redirect_to("submit.processing")
 
     except Exception as e:
-        logger.error(f"Failed to submit job: {e}", exc_info=True)
+        logger.error("Failed to submit job: %s", e, exc_info=True)
         flash(f"Failed to start job: {str(e)}", "error")
 
-        # Store error in session
+        # Store error on the order
         order_dict["result"] = {
             "job_id": "error",
             "submitted_at": datetime.utcnow().isoformat(),
@@ -107,9 +109,8 @@ def submit():
             "transaction_success": False,
             "notes": f"Submission error: {str(e)}"
         }
-        session.modified = True
 
-        return redirect(url_for("confirmation.confirmation"))
+        return redirect_to("confirmation.confirmation")
 
 
 @submit_bp.route("/processing", methods=["GET"])
@@ -119,12 +120,11 @@ def processing():
 
     This page uses AJAX to poll job status and redirect when complete.
     """
-    order = session.get("order")
+    order = get_order()
     job_id = session.get("job_id")
 
     if not order or not job_id:
         flash("No active job found. Please submit a new order.", "warning")
-        return redirect(url_for("upload.upload"))
+        return redirect_to("upload.upload")
 
-    from flask import render_template
     return render_template("processing.html", order=order)
@@ -2,26 +2,26 @@
 PDF upload route.
 
 Handles file upload, validation, and PDF analysis.
-Stores order in session and redirects to details.
+Stores order server-side and redirects to details.
 """
 
-from datetime import datetime
+import re
+import time
 from pathlib import Path
 
-import bleach
 from flask import (
     Blueprint,
     current_app,
     flash,
-    redirect,
     render_template,
     request,
-    session,
-    url_for,
 )
 from werkzeug.utils import secure_filename
 
 from logging_config import get_logger
+from modules.text_sanitizer import sanitize_text
+from routes.order_session import get_order, new_order
+from routes.urls import redirect_to
 
 
 # Module logger
@@ -30,41 +30,46 @@ logger = get_logger(__name__)
 upload_bp = Blueprint("upload", __name__)
 
 # Constants
-ALLOWED_EXTENSIONS = {"pdf"}
+ALLOWED_EXTENSIONS = frozenset({"pdf"})
+_ALLOWED_SUFFIXES = tuple("." + ext for ext in sorted(ALLOWED_EXTENSIONS))
 MAX_FILENAME_LENGTH = 255
 MAX_JOB_NAME_LENGTH = 200
 
+# Copy buffer for saving uploads. Werkzeug defaults to 16 KB, which is
+# ~1000 read/write pairs for a 16 MB PDF; 1 MB keeps it to a handful.
+UPLOAD_SAVE_BUFFER_SIZE = 1024 * 1024
 
-def _allowed_file(filename: str) -> bool:
-    """Check if file extension is allowed."""
-    return "." in filename and filename.rsplit(".", 1)[1].lower() in ALLOWED_EXTENSIONS
 
+# Filenames secure_filename() returns unchanged: ASCII letters, digits and
+# "._-" only, not starting with "." or "_", with a .pdf extension
+_SAFE_FILENAME_RE = re.compile(r"[A-Za-z0-9-][A-Za-z0-9._-]*\.pdf", re.IGNORECASE)
 
-def _sanitize_text(text: str, max_length: int = None) -> str:
-    """
-    Sanitize user input text to prevent XSS and injection attacks.
+# Windows device names secure_filename() prefixes with "_" (on Windows)
+_WINDOWS_DEVICE_NAMES = frozenset(
+    {"CON", "PRN", "AUX", "NUL"}
+    | {f"COM{i}" for i in range(1, 10)}
+    | {f"LPT{i}" for i in range(1, 10)}
+)
 
-    Args:
-        text: Raw input text
-        max_length: Optional maximum length to enforce
 
-    Returns:
-        Sanitized text safe for storage and display
+def _safe_filename(filename: str) -> str:
     """
-    if not text:
-        return ""
-
-    # Strip whitespace
-    text = text.strip()
+    Return a filename that is safe to store, like secure_filename().
 
-    # Bleach HTML tags and attributes
-    text = bleach.clean(text, tags=[], strip=True)
+    Names that are already safe (the usual "report-v2.pdf") are returned as
+    is, skipping secure_filename()'s unicode normalization and rewriting.
+    """
+    if (
+        _SAFE_FILENAME_RE.fullmatch(filename)
+        and filename.partition(".")[0].upper() not in _WINDOWS_DEVICE_NAMES
+    ):
+        return filename
+    return secure_filename(filename)
 
-    # Truncate if needed
-    if max_length and len(text) > max_length:
-        text = text[:max_length]
 
-    return text
+def _allowed_file(filename: str) -> bool:
+    """Check if file extension is allowed."""
+    return filename.lower().endswith(_ALLOWED_SUFFIXES)
 
 
 def _validate_file_size(content_length: int) -> tuple[bool, str]:
@@ -98,7 +103,7 @@ def upload():
     if request.method == "POST":
         try:
             # Get and sanitize job name
-            job_name = _sanitize_text(
+            job_name = sanitize_text(
                 request.form.get("job_name", ""),
                 max_length=MAX_JOB_NAME_LENGTH
             )
@@ -107,56 +112,56 @@ def upload():
             # Validation: Job name required
             if not job_name:
                 flash("Please provide a job name.", "error")
-                return redirect(url_for("upload.upload"))
+                return redirect_to("upload.upload")
 
             # Validation: File required
             if not pdf_file or pdf_file.filename == "":
                 flash("Please choose a PDF file to upload.", "error")
-                return redirect(url_for("upload.upload"))
+                return redirect_to("upload.upload")
 
             # Validation: File type
             if not _allowed_file(pdf_file.filename):
                 flash("Unsupported file type. Please upload a PDF document.", "error")
-                return redirect(url_for("upload.upload"))
+                return redirect_to("upload.upload")
 
             # Validation: File size (check content length if available)
             if request.content_length:
                 is_valid, error_msg = _validate_file_size(request.content_length)
                 if not is_valid:
                     flash(error_msg, "error")
-                    return redirect(url_for("upload.upload"))
+                    return redirect_to("upload.upload")
 
             # Validation: Filename length
             if len(pdf_file.filename) > MAX_FILENAME_LENGTH:
                 flash(f"Filename too long. Maximum {MAX_FILENAME_LENGTH} characters.", "error")
-                return redirect(url_for("upload.upload"))
+                return redirect_to("upload.upload")
 
             # Get upload folder from config
             upload_folder = Path(current_app.config["UPLOAD_FOLDER"])
 
-            # Save file with timestamp prefix
-            timestamp = datetime.utcnow().strftime("%Y%m%d%H%M%S")
-            safe_name = secure_filename(pdf_file.filename)
+            # Save file with timestamp prefix (epoch milliseconds: sortable,
+            # and two uploads of the same file within a second don't collide)
+            timestamp = format(time.time_ns() // 1_000_000, "013d")
+            safe_name = _safe_filename(pdf_file.filename)
             stored_name = f"{timestamp}_{safe_name}"
             stored_path = upload_folder / stored_name
 
-            logger.info(f"Saving uploaded file: {stored_name}")
-            pdf_file.save(stored_path)
+            logger.info("Saving uploaded file: %s", stored_name)
+            pdf_file.save(stored_path, buffer_size=UPLOAD_SAVE_BUFFER_SIZE)
 
             # Analyze PDF using the analyzer from app context
             pdf_analyzer = current_app.config.get("PDF_ANALYZER")
             if pdf_analyzer:
-                logger.debug(f"Analyzing PDF: {stored_path}")
+                logger.debug("Analyzing PDF: %s", stored_path)
                 analysis = pdf_analyzer.analyze(stored_path)
-                logger.info(f"PDF analysis complete: {analysis.get('pages')} pages")
+                logger.info("PDF analysis complete: %s pages", analysis.get("pages"))
             else:
                 # Fallback if analyzer not configured
                 analysis = {"pages": 1, "width_mm": 210, "height_mm": 297}
                 logger.warning("PDF analyzer not configured, using defaults")
 
-            # Store in session (clear any previous order)
-            order = session.setdefault("order", {})
-            order.clear()
+            # Start a new order (discards any previous one)
+            order = new_order()
             order.update({
                 "job_name": job_name,
                 "uploaded_at": timestamp,
@@ -165,15 +170,14 @@ def upload():
                 "stored_path": str(stored_path),
                 "analysis": analysis,
             })
-            session.modified = True
 
             flash("PDF uploaded successfully.", "success")
-            return redirect(url_for("details.details"))
+            return redirect_to("details.details")
 
         except Exception as e:
-            logger.error(f"Upload failed: {e}", exc_info=True)
+            logger.error("Upload failed: %s", e, exc_info=True)
             flash(f"Failed to upload file: {str(e)}", "error")
-            return redirect(url_for("upload.upload"))
+            return redirect_to("upload.upload")
 
     # GET request - display upload form
-    return render_template("upload.html", order=session.get("order"))
+    return render_template("upload.html", order=get_order())
@@ -0,0 +1,51 @@
+"""
+Pre-resolved redirect targets.
+
+Route handlers redirect to a handful of argument-less pages, mostly from
+validation branches in upload and details. Their paths never change, so
+they are resolved with url_for() once when the blueprints are registered
+and looked up from app.config["ROUTE_URLS"] afterwards.
+"""
+
+from typing import Dict
+
+from flask import Flask, current_app, redirect, url_for
+from werkzeug.wrappers import Response
+
+
+# Endpoints handlers redirect to (none take URL arguments)
+REDIRECT_ENDPOINTS = (
+    "main.demo",
+    "upload.upload",
+    "details.details",
+    "review.review",
+    "submit.processing",
+    "confirmation.confirmation",
+)
+
+
+def resolve_route_urls(app: Flask) -> Dict[str, str]:
+    """
+    Resolve the redirect endpoints to their paths.
+
+    Args:
+        app: Flask application with all blueprints registered
+
+    Returns:
+        Dict mapping endpoint name to URL path
+    """
+    with app.test_request_context():
+        return {endpoint: url_for(endpoint) for endpoint in REDIRECT_ENDPOINTS}
+
+
+def redirect_to(endpoint: str) -> Response:
+    """
+    Redirect to one of REDIRECT_ENDPOINTS.
+
+    Args:
+        endpoint: Endpoint name, e.g. "upload.upload"
+
+    Returns:
+        Redirect response
+    """
+    return redirect(current_app.config["ROUTE_URLS"][endpoint])
@@ -3,22 +3,32 @@ Services layer for PrintOrderWeb.
 
 This module contains the business logic services:
 - InventoryService: Background inventory refresh thread
-- JobService: Job submission threads and result store
+- JobService: Job worker pool and result store
+- OrderStore: Server-side storage for in-progress orders
 
 Thread Model:
     Main Thread (Flask)
     ├── InventoryService thread (30-second refresh loop)
-    └── JobService threads (one per job submission)
+    └── JobService worker threads (bounded pool, one job at a time each)
 
-Each service creates its own ConsumableAPIClient instance,
+Each service thread uses its own ConsumableAPIClient instance,
 ensuring complete thread isolation.
+
+Access:
+    create_app() stores the service instances in app.config
+    ("INVENTORY_SERVICE", "JOB_SERVICE", "ORDER_STORE", "DLL_MANAGER"). Routes look them up
+    once per request; the per-render context processors close over the
+    instances directly. They are deliberately not module globals, so each
+    create_app() call (e.g. in tests) gets its own services.
 """
 
 from .inventory_service import InventoryService
 from .job_service import JobService, JobResultStore
+from .order_store import OrderStore
 
 __all__ = [
     "InventoryService",
     "JobService",
     "JobResultStore",
+    "OrderStore",
 ]
@@ -9,6 +9,12 @@ COMPLETE THREAD ISOLATION:
     - It does NOT share any state with job submission
     - Routes read inventory via get_snapshot() which returns immutable data
 
+Freshness:
+    - The background thread is the only thing that should fetch inventory
+      during request handling. Routes that know inventory changed (a job
+      completed, a new order started) call request_refresh(force=True), which
+      wakes the thread without blocking the request.
+
 Thread Safety:
     - Background thread creates new InventorySnapshot on each refresh
     - Main thread reads current snapshot via atomic reference
@@ -22,8 +28,8 @@ Usage:
     # In routes (main thread)
     snapshot = inventory_service.get_snapshot()
     if snapshot.is_stale:
-        # Show warning, but still use data
-        pass
+        # Show warning, but still use data; ask for an early refresh
+        inventory_service.request_refresh()
 
     # At app shutdown
     inventory_service.stop()
@@ -31,6 +37,8 @@ Usage:
 
 from __future__ import annotations
 
+import dataclasses
+import itertools
 import threading
 import time
 from typing import Optional
@@ -38,13 +46,19 @@ from typing import Optional
 from core.dll_manager import DLLManager
 from core.api_client import ConsumableAPIClient
 from core.exceptions import InventoryNotReadyError
-from models.inventory import InventorySnapshot
+from models.inventory import InventoryHealth, InventorySnapshot
+from modules.printer_context import build_printer_context
 from logging_config import get_logger, set_thread_name
 
 
 # Module logger
 logger = get_logger(__name__)
 
+# Minimum seconds between refresh attempts triggered by request_refresh().
+# Stale data usually means refreshes are failing, so every request asking
+# for one must not turn into back-to-back DLL calls.
+_MIN_REQUESTED_REFRESH_INTERVAL = 5.0
+
 
 class InventoryService:
     """
@@ -88,16 +102,30 @@ class InventoryService:
         # Thread control
         self._thread: Optional[threading.Thread] = None
         self._stop_event = threading.Event()
+        self._wake_event = threading.Event()
         self._is_running = False
 
+        # Monotonic time of the last refresh attempt (for request_refresh)
+        self._last_attempt = 0.0
+
         # Current inventory snapshot (atomic reference)
         # Start with empty snapshot so get_snapshot() never returns None
         self._current_snapshot: InventorySnapshot = InventorySnapshot.create_empty()
 
+        # Snapshot version source. force_refresh() can run in a request thread
+        # alongside the refresh thread; next() on a count is atomic under the GIL.
+        self._snapshot_versions = itertools.count(1)
+
         # Track consecutive failures for logging
         self._consecutive_failures = 0
 
-        logger.info(f"InventoryService initialized (refresh interval: {refresh_interval_seconds}s)")
+        # Per-thread API clients (refresh thread, plus any force_refresh() caller)
+        self._thread_local = threading.local()
+
+        logger.info(
+            "InventoryService initialized (refresh interval: %ss)",
+            refresh_interval_seconds
+        )
 
     @property
     def is_running(self) -> bool:
@@ -126,6 +154,7 @@ class InventoryService:
 
         # Clear stop event in case of restart
         self._stop_event.clear()
+        self._wake_event.clear()
 
         # Create and start background thread
         self._thread = threading.Thread(
@@ -150,8 +179,9 @@ class InventoryService:
 
         logger.info("Stopping inventory refresh thread...")
 
-        # Signal thread to stop
+        # Signal thread to stop (and wake it if it is waiting)
         self._stop_event.set()
+        self._wake_event.set()
 
         # Wait for thread to finish (with timeout)
         if self._thread and self._thread.is_alive():
@@ -196,7 +226,7 @@ class InventoryService:
         snapshot = self._current_snapshot
 
         # Check if we have any data
-        if not snapshot.toner_balances and not snapshot.media_options:
+        if snapshot.health is InventoryHealth.UNAVAILABLE:
             raise InventoryNotReadyError(
                 "Inventory not yet loaded. Please wait for initial fetch."
             )
@@ -215,7 +245,8 @@ class InventoryService:
         Force an immediate inventory refresh.
 
         This runs in the calling thread, not the background thread.
-        Use sparingly - prefer waiting for scheduled refresh.
+        Use sparingly - prefer waiting for scheduled refresh. Request
+        handlers should use request_refresh() instead, which does not block.
 
         Returns:
             True if refresh succeeded, False otherwise
@@ -223,11 +254,27 @@ class InventoryService:
         logger.info("Forcing inventory refresh...")
         return self._do_refresh()
 
+    def request_refresh(self, force: bool = False) -> None:
+        """
+        Ask the background thread to refresh now instead of at the next interval.
+
+        Non-blocking - callers keep using the current snapshot. Requests made
+        within a few seconds of the last attempt are ignored unless forced.
+
+        Args:
+            force: Wake the thread even if a refresh just ran (use when
+                balances are known to have changed, e.g. a job completed)
+        """
+        if not force and time.monotonic() - self._last_attempt < _MIN_REQUESTED_REFRESH_INTERVAL:
+            return
+        self._wake_event.set()
+
     def _refresh_loop(self) -> None:
         """
         Background thread main loop.
 
-        Fetches inventory immediately, then every refresh_interval_seconds.
+        Fetches inventory immediately, then every refresh_interval_seconds
+        (measured start to start) or sooner when request_refresh() wakes it.
         Runs until stop_event is set.
         """
         # Set thread name for logging
@@ -235,42 +282,98 @@ class InventoryService:
 
         logger.info("Inventory refresh loop starting")
 
+        # Refreshes are scheduled on the monotonic clock, so the time a
+        # refresh takes does not push every later one back
+        next_refresh = time.monotonic() + self._refresh_interval
+
         # Initial fetch
         self._do_refresh()
 
         # Refresh loop
         while not self._stop_event.is_set():
-            # Wait for interval (or stop event)
-            if self._stop_event.wait(timeout=self._refresh_interval):
-                # Stop event was set
+            # Wait for the next scheduled refresh (or an early wake-up / stop)
+            requested = self._wake_event.wait(
+                timeout=max(0.0, next_refresh - time.monotonic())
+            )
+            self._wake_event.clear()
+            if self._stop_event.is_set():
                 break
 
+            started = time.monotonic()
+
             # Refresh inventory
             self._do_refresh()
 
+            if requested:
+                # An on-demand refresh restarts the interval
+                next_refresh = started + self._refresh_interval
+            else:
+                next_refresh += self._refresh_interval
+                if next_refresh <= time.monotonic():
+                    # Overran a whole interval - don't try to catch up
+                    next_refresh = time.monotonic() + self._refresh_interval
+
         logger.info("Inventory refresh loop exiting")
 
-    def _do_refresh(self) -> bool:
+    def _with_display_context(self, snapshot: InventorySnapshot) -> InventorySnapshot:
         """
-        Perform a single inventory refresh.
+        Attach the prebuilt sidebar display context to a new snapshot.
 
-        Creates a new API client for this fetch (thread owns the client),
-        fetches fresh template, and creates new immutable snapshot.
+        A failure here must not discard fresh inventory data - the snapshot
+        is published without a display context and the UI falls back to
+        its empty state.
+
+        Args:
+            snapshot: Freshly parsed snapshot
 
         Returns:
-            True if refresh succeeded, False otherwise
+            Copy of the snapshot with display_context populated
         """
-        logger.debug("Refreshing inventory - starting...")
-
         try:
-            # Create API client for THIS thread
-            # Each refresh gets a fresh client - complete isolation
+            context = build_printer_context(snapshot)
+        except Exception as e:
+            logger.error("Failed to build display context: %s", e)
+            return snapshot
+
+        return dataclasses.replace(snapshot, display_context=context)
+
+    def _get_api_client(self) -> ConsumableAPIClient:
+        """
+        Get the calling thread's own API client, creating it on first use.
+
+        The refresh thread reuses one client for every refresh; a client is
+        never shared with another thread.
+
+        Returns:
+            ConsumableAPIClient owned by the current thread
+        """
+        api_client = getattr(self._thread_local, "api_client", None)
+        if api_client is None:
             logger.debug("Creating API client...")
             api_client = ConsumableAPIClient(
                 context_handle=self._dll_manager.context_handle,
                 library=self._dll_manager.library,
                 logger=logger
             )
+            self._thread_local.api_client = api_client
+        return api_client
+
+    def _do_refresh(self) -> bool:
+        """
+        Perform a single inventory refresh.
+
+        Uses the calling thread's API client (thread owns the client),
+        fetches fresh template, and creates new immutable snapshot.
+
+        Returns:
+            True if refresh succeeded, False otherwise
+        """
+        logger.debug("Refreshing inventory - starting...")
+        self._last_attempt = time.monotonic()
+
+        try:
+            # API client for THIS thread (never shared between threads)
+            api_client = self._get_api_client()
 
             # Fetch fresh template from blockchain
             logger.debug("Fetching template from blockchain...")
@@ -278,7 +381,13 @@ class InventoryService:
             logger.debug("Template fetched, creating snapshot...")
 
             # Create new immutable snapshot
-            new_snapshot = InventorySnapshot.from_template(template)
+            new_snapshot = InventorySnapshot.from_template(
+                template, version=next(self._snapshot_versions)
+            )
+
+            # Build the sidebar display context here, once per refresh, so
+            # requests never walk the raw template themselves
+            new_snapshot = self._with_display_context(new_snapshot)
             logger.debug("Snapshot created, swapping reference...")
 
             # Atomic reference swap (Python GIL makes this thread-safe)
@@ -287,15 +396,16 @@ class InventoryService:
             # Reset failure counter on success
             if self._consecutive_failures > 0:
                 logger.info(
-                    f"Inventory refresh recovered after {self._consecutive_failures} failures"
+                    "Inventory refresh recovered after %s failures",
+                    self._consecutive_failures
                 )
             self._consecutive_failures = 0
 
             # Log summary at DEBUG level to avoid filling logs every 30 seconds
             # Errors are still logged at WARNING/ERROR level
             logger.debug(
-                f"Inventory refreshed: {len(new_snapshot.toner_balances)} toners, "
-                f"{len(new_snapshot.media_options)} media options"
+                "Inventory refreshed: %s toners, %s media options",
+                len(new_snapshot.toner_balances), len(new_snapshot.media_options)
             )
 
             return True
@@ -303,16 +413,23 @@ class InventoryService:
         except Exception as e:
             self._consecutive_failures += 1
 
+            # Start the next attempt from a new client
+            self._thread_local.api_client = None
+
             # Log with increasing severity based on consecutive failures
             if self._consecutive_failures == 1:
-                logger.warning(f"Inventory refresh failed: {e}")
+                logger.warning("Inventory refresh failed: %s", e)
             elif self._consecutive_failures <= 3:
-                logger.error(f"Inventory refresh failed ({self._consecutive_failures} consecutive): {e}")
+                logger.error(
+                    "Inventory refresh failed (%s consecutive): %s",
+                    self._consecutive_failures, e
+                )
             else:
                 # Only log every 5th failure after that to avoid spam
                 if self._consecutive_failures % 5 == 0:
                     logger.error(
-                        f"Inventory refresh still failing ({self._consecutive_failures} consecutive): {e}"
+                        "Inventory refresh still failing (%s consecutive): %s",
+                        self._consecutive_failures, e
                     )
 
             return False
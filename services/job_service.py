@@ -1,11 +1,12 @@
 """
-Job submission service with thread-per-job architecture.
+Job submission service with a bounded pool of job worker threads.
 
 This service handles job submission to the blockchain in background threads.
-Each job gets its own thread and its own API client - complete isolation.
+Jobs are queued to a fixed-size pool of worker threads; each worker runs one
+job at a time with its own API client - complete isolation.
 
 COMPLETE THREAD ISOLATION:
-    - Each job thread creates its OWN ConsumableAPIClient
+    - Each job worker thread has its OWN ConsumableAPIClient (thread-local)
     - Job threads do NOT share API clients with inventory service
     - Job threads do NOT share state with each other
     - JobResultStore is the ONLY communication channel back to main thread
@@ -18,7 +19,7 @@ Thread Safety:
 Flow:
     1. Main thread creates FrozenOrder (immutable snapshot)
     2. Main thread calls job_service.submit_job(frozen_order)
-    3. Job thread starts with its OWN API client
+    3. A job worker picks it up with its OWN API client
     4. Job thread fetches FRESH template (not cached inventory!)
     5. Job thread builds payload, submits to blockchain
     6. Job thread stores JobResult in JobResultStore
@@ -46,9 +47,12 @@ Usage:
 
 from __future__ import annotations
 
+import logging
+import os
+import queue
 import threading
 import uuid
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Set, Tuple
 
 from core.dll_manager import DLLManager
 from core.api_client import ConsumableAPIClient
@@ -61,6 +65,76 @@ from logging_config import get_logger, get_job_logger, set_thread_name
 # Module logger
 logger = get_logger(__name__)
 
+# Default job worker count. Job threads spend nearly all their time blocked
+# in the DLL waiting on the blockchain, so this is sized like an I/O pool.
+_DEFAULT_MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+
+def _index_template_accounts(
+    wallets: List[Dict]
+) -> Tuple[Dict[str, List[Dict]], Dict[str, List[Dict]]]:
+    """
+    Index template accounts for payload building.
+
+    Toner accounts are keyed by lowercase projectData Color, media accounts
+    by mintId. Values are lists because several wallets may hold the same
+    consumable; the indexed dicts are the template's own account objects.
+
+    Args:
+        wallets: inventoryParameters.wallets from a job template
+
+    Returns:
+        Tuple of (toner accounts by color, media accounts by mintId)
+    """
+    toner_accounts: Dict[str, List[Dict]] = {}
+    media_accounts: Dict[str, List[Dict]] = {}
+
+    for wallet in wallets:
+        for account in wallet.get("accounts", []):
+            # Navigate to UOM to determine type
+            inner_meta = account.get("metadata", {}).get("metadata", {})
+            uom = inner_meta.get("uom", "")
+
+            if uom == "Toner":
+                project_data = inner_meta.get("tokenDescription", {}).get("projectData", {})
+                color = project_data.get("Color", "").lower()
+                toner_accounts.setdefault(color, []).append(account)
+
+            elif uom == "Media":
+                media_accounts.setdefault(account.get("mintId", ""), []).append(account)
+
+    return toner_accounts, media_accounts
+
+
+def _account_details_by_mint(template: Dict) -> Dict[str, Tuple[str, str]]:
+    """
+    Map each template account's mintId to its (uom, name).
+
+    Built once when the template is fetched so result parsing can classify
+    ledger accounts with one dict lookup instead of walking each result
+    account's nested metadata.
+
+    Args:
+        template: Job template from the DLL
+
+    Returns:
+        Dict of mintId -> (uom, name); accounts without a mintId are skipped
+    """
+    details: Dict[str, Tuple[str, str]] = {}
+
+    for wallet in template.get("inventoryParameters", {}).get("wallets", []):
+        for account in wallet.get("accounts", []):
+            mint_id = account.get("mintId", "")
+            if not mint_id:
+                continue
+            inner_meta = account.get("metadata", {}).get("metadata", {})
+            details[mint_id] = (
+                inner_meta.get("uom", ""),
+                inner_meta.get("name", ""),
+            )
+
+    return details
+
 
 class JobResultStore:
     """
@@ -70,7 +144,10 @@ class JobResultStore:
     Job threads WRITE results here, main thread READS (and removes) results.
 
     Thread Safety:
-        - Uses threading.Lock for all operations
+        - Uses threading.Lock for all writes and for removing results
+        - Lookups that find nothing (the common "still running" poll) skip
+          the lock: a dict membership test is atomic under the GIL, and a
+          miss that races with put_result() is simply seen on the next poll
         - Results are stored by job_id
         - get_result() removes the result (consume-once pattern)
 
@@ -98,7 +175,7 @@ class JobResultStore:
         """
         with self._lock:
             self._results[result.job_id] = result
-            logger.debug(f"Stored result for job {result.job_id[:8]}")
+            logger.debug("Stored result for job %s", result.job_id[:8])
 
     def get_result(self, job_id: str) -> Optional[JobResult]:
         """
@@ -113,10 +190,14 @@ class JobResultStore:
         Returns:
             JobResult if available, None otherwise
         """
+        # Fast path: nothing stored yet (no lock needed to see that)
+        if job_id not in self._results:
+            return None
+
         with self._lock:
             result = self._results.pop(job_id, None)
             if result:
-                logger.debug(f"Retrieved result for job {job_id[:8]}")
+                logger.debug("Retrieved result for job %s", job_id[:8])
             return result
 
     def peek_result(self, job_id: str) -> Optional[JobResult]:
@@ -131,8 +212,8 @@ class JobResultStore:
         Returns:
             JobResult if available, None otherwise
         """
-        with self._lock:
-            return self._results.get(job_id)
+        # Single dict read - atomic under the GIL
+        return self._results.get(job_id)
 
     def clear(self) -> int:
         """
@@ -144,7 +225,7 @@ class JobResultStore:
         with self._lock:
             count = len(self._results)
             self._results.clear()
-            logger.info(f"Cleared {count} job results from store")
+            logger.info("Cleared %s job results from store", count)
             return count
 
 
@@ -152,8 +233,9 @@ class JobService:
     """
     Service for submitting jobs to the blockchain.
 
-    Creates one thread per job submission. Each thread:
-    1. Creates its own ConsumableAPIClient (isolation from inventory)
+    Runs jobs on a bounded pool of daemon worker threads fed by a queue.
+    Workers are started on demand, up to max_workers. For each job, a worker:
+    1. Uses its own ConsumableAPIClient (isolation from inventory)
     2. Fetches a FRESH template from blockchain (not cached!)
     3. Builds the job payload with consumption data
     4. Submits to blockchain and waits for confirmation
@@ -166,27 +248,44 @@ class JobService:
         result_store: JobResultStore for reading job results
     """
 
-    def __init__(self, dll_manager: DLLManager):
+    def __init__(self, dll_manager: DLLManager, max_workers: Optional[int] = None):
         """
         Initialize job service.
 
         Args:
             dll_manager: Initialized DLLManager with context handle
+            max_workers: Maximum concurrent jobs (default scales with CPU count)
 
         Raises:
-            ValueError: If dll_manager is not initialized
+            ValueError: If dll_manager is not initialized or max_workers <= 0
         """
         if not dll_manager.is_initialized:
             raise ValueError("DLLManager must be initialized before creating JobService")
+        if max_workers is not None and max_workers <= 0:
+            raise ValueError("max_workers must be greater than 0")
 
         self._dll_manager = dll_manager
         self._result_store = JobResultStore()
+        self._max_workers = max_workers if max_workers is not None else _DEFAULT_MAX_WORKERS
 
-        # Track active job threads for cleanup
-        self._active_threads: Dict[str, threading.Thread] = {}
+        # Work queue of (job_id, frozen_order, timeout_seconds); None stops a worker
+        self._job_queue: queue.Queue = queue.Queue()
+
+        # Worker threads, and a count of idle ones so a submission only
+        # starts a new worker when none is free (same scheme as
+        # concurrent.futures.ThreadPoolExecutor, but with daemon threads
+        # so a hung DLL call cannot block interpreter exit)
+        self._workers: List[threading.Thread] = []
+        self._idle_workers = threading.Semaphore(0)
+
+        # Jobs queued or running, for is_job_pending() and shutdown()
+        self._pending_jobs: Set[str] = set()
         self._threads_lock = threading.Lock()
 
-        logger.info("JobService initialized")
+        # Per-thread API clients (see _get_api_client)
+        self._thread_local = threading.local()
+
+        logger.info("JobService initialized (max %s job workers)", self._max_workers)
 
     @property
     def result_store(self) -> JobResultStore:
@@ -202,8 +301,8 @@ class JobService:
         """
         Submit a job for background processing.
 
-        Creates a new thread that will:
-        1. Create its own API client
+        Queues the job for a worker thread that will:
+        1. Use its own API client
         2. Fetch fresh template from blockchain
         3. Build and submit the job payload
         4. Store result in result_store
@@ -224,22 +323,16 @@ class JobService:
         if job_id is None:
             job_id = str(uuid.uuid4())
 
-        logger.info(f"Submitting job {job_id[:8]} for '{frozen_order.job_name}'")
-
-        # Create job thread
-        thread = threading.Thread(
-            target=self._job_thread_main,
-            args=(job_id, frozen_order, timeout_seconds),
-            name=f"Job-{job_id[:8]}",
-            daemon=True
-        )
+        short_id = job_id[:8]
+        logger.info("Submitting job %s for '%s'", short_id, frozen_order.job_name)
 
-        # Track thread
+        # Track job
         with self._threads_lock:
-            self._active_threads[job_id] = thread
+            self._pending_jobs.add(job_id)
 
-        # Start thread
-        thread.start()
+        # Queue job, starting a worker if none is idle
+        self._job_queue.put((job_id, frozen_order, timeout_seconds))
+        self._ensure_worker()
 
         return job_id
 
@@ -263,38 +356,94 @@ class JobService:
             job_id: UUID of the job
 
         Returns:
-            True if job thread is still running
+            True if job is queued or still running
         """
-        with self._threads_lock:
-            thread = self._active_threads.get(job_id)
-            return thread is not None and thread.is_alive()
+        # Set membership is atomic under the GIL; writers hold the lock
+        return job_id in self._pending_jobs
 
     def shutdown(self, timeout_per_thread: float = 5.0) -> None:
         """
-        Wait for all active job threads to complete.
+        Stop the job workers, waiting for active jobs to complete.
 
         Call this during application shutdown.
 
         Args:
-            timeout_per_thread: Max seconds to wait per thread
+            timeout_per_thread: Max seconds to wait per worker thread
         """
         with self._threads_lock:
-            active = list(self._active_threads.items())
+            pending = len(self._pending_jobs)
+            workers = list(self._workers)
+            self._workers.clear()
 
-        if not active:
-            logger.info("No active job threads to wait for")
-            return
+        # One stop sentinel per worker, queued behind any remaining jobs
+        for _ in workers:
+            self._job_queue.put(None)
 
-        logger.info(f"Waiting for {len(active)} job threads to complete...")
+        if not pending:
+            logger.info("No active job threads to wait for")
+        else:
+            logger.info("Waiting for %s jobs to complete...", pending)
 
-        for job_id, thread in active:
+        for thread in workers:
+            thread.join(timeout=timeout_per_thread)
             if thread.is_alive():
-                thread.join(timeout=timeout_per_thread)
-                if thread.is_alive():
-                    logger.warning(f"Job thread {job_id[:8]} did not complete in time")
+                logger.warning("Job worker %s did not complete in time", thread.name)
 
         logger.info("Job service shutdown complete")
 
+    def _ensure_worker(self) -> None:
+        """Start a worker thread for a newly queued job if none is idle."""
+        if self._idle_workers.acquire(blocking=False):
+            return
+
+        with self._threads_lock:
+            if len(self._workers) >= self._max_workers:
+                return
+            thread = threading.Thread(
+                target=self._worker_main,
+                name=f"JobWorker-{len(self._workers) + 1}",
+                daemon=True
+            )
+            self._workers.append(thread)
+
+        thread.start()
+
+    def _worker_main(self) -> None:
+        """Job worker loop: run queued jobs until a stop sentinel arrives."""
+        while True:
+            item = self._job_queue.get()
+            if item is None:
+                return
+
+            self._job_thread_main(*item)
+            self._idle_workers.release()
+
+    def _get_api_client(self, job_logger: logging.LoggerAdapter) -> ConsumableAPIClient:
+        """
+        Get the calling thread's own API client, creating it on first use.
+
+        A client is never shared between threads, so isolation is the same
+        as creating one per job; a thread that runs several jobs reuses it.
+
+        Args:
+            job_logger: Logger for the job about to use the client
+
+        Returns:
+            ConsumableAPIClient owned by the current thread
+        """
+        api_client = getattr(self._thread_local, "api_client", None)
+        if api_client is None:
+            job_logger.debug("Creating API client for this thread...")
+            api_client = ConsumableAPIClient(
+                context_handle=self._dll_manager.context_handle,
+                library=self._dll_manager.library,
+                logger=job_logger
+            )
+            self._thread_local.api_client = api_client
+        else:
+            api_client.logger = job_logger
+        return api_client
+
     def _job_thread_main(
         self,
         job_id: str,
@@ -304,7 +453,7 @@ class JobService:
         """
         Main function for job submission thread.
 
-        This runs in its own thread with complete isolation:
+        This runs on a job worker thread with complete isolation:
         - Own API client (not shared with inventory)
         - Fresh template from blockchain (not cached)
         - Independent lifecycle
@@ -318,24 +467,20 @@ class JobService:
         set_thread_name(f"Job-{job_id[:8]}")
         job_logger = get_job_logger(job_id)
 
-        job_logger.info(f"Job thread starting for '{frozen_order.job_name}'")
+        job_logger.info("Job thread starting for '%s'", frozen_order.job_name)
 
         try:
             # =================================================================
-            # STEP 1: Create OWN API client (complete isolation)
+            # STEP 1: Get this thread's OWN API client (complete isolation)
             # =================================================================
-            job_logger.debug("Creating API client for this thread...")
-            api_client = ConsumableAPIClient(
-                context_handle=self._dll_manager.context_handle,
-                library=self._dll_manager.library,
-                logger=job_logger
-            )
+            api_client = self._get_api_client(job_logger)
 
             # =================================================================
             # STEP 2: Fetch FRESH template (NOT cached inventory!)
             # =================================================================
             job_logger.info("Fetching fresh template from blockchain...")
             template = api_client.new_job_template()
+            account_details = _account_details_by_mint(template)
 
             # =================================================================
             # STEP 3: Build job payload with consumption data
@@ -349,7 +494,7 @@ class JobService:
             job_logger.info("Submitting job to blockchain...")
             job_handle = api_client.submit_job(payload)
 
-            job_logger.info(f"Job submitted, handle={job_handle}, waiting for confirmation...")
+            job_logger.info("Job submitted, handle=%s, waiting for confirmation...", job_handle)
 
             # =================================================================
             # STEP 5: Wait for blockchain confirmation
@@ -363,12 +508,14 @@ class JobService:
             # STEP 6: Parse result and store
             # =================================================================
             job_logger.info("Parsing job result...")
-            result = self._parse_result(job_id, status, frozen_order, job_handle)
+            result = self._parse_result(
+                job_id, status, frozen_order, job_handle, account_details
+            )
 
-            job_logger.info(f"Job completed: status={result.status.value}")
+            job_logger.info("Job completed: status=%s", result.status.value)
 
         except Exception as e:
-            job_logger.error(f"Job failed: {e}")
+            job_logger.error("Job failed: %s", e)
 
             # Create failed result
             result = JobResult.create_failed(
@@ -381,9 +528,9 @@ class JobService:
             # Store result for main thread to retrieve
             self._result_store.put_result(result)
 
-            # Remove from active threads
+            # Remove from pending jobs
             with self._threads_lock:
-                self._active_threads.pop(job_id, None)
+                self._pending_jobs.discard(job_id)
 
             job_logger.info("Job thread exiting")
 
@@ -412,46 +559,43 @@ class JobService:
         sheets_required = frozen_order.sheets_required
         media_mint_id = frozen_order.media_type
 
-        job_logger.debug(f"Building payload: toner={toner_usage}, sheets={sheets_required}")
+        # Per-account detail is only useful when debugging; skip building the
+        # messages entirely otherwise and log one summary line at the end
+        debug_enabled = job_logger.isEnabledFor(logging.DEBUG)
+        if debug_enabled:
+            job_logger.debug("Building payload: toner=%s, sheets=%s", toner_usage, sheets_required)
 
         # Navigate to accounts
         inventory_params = template.get("inventoryParameters", {})
         wallets = inventory_params.get("wallets", [])
 
+        # Index the template once, then apply each usage by key instead of
+        # re-checking every account against the order
+        toner_accounts, media_accounts = _index_template_accounts(wallets)
+
         toner_matches = 0
         media_matches = 0
+        unmatched_colors = []
 
-        for wallet in wallets:
-            accounts = wallet.get("accounts", [])
-
+        for color, usage in toner_usage.items():
+            accounts = toner_accounts.get(color)
+            if not accounts:
+                unmatched_colors.append(color)
+                continue
             for account in accounts:
-                mint_id = account.get("mintId", "")
-
-                # Navigate to UOM to determine type
-                outer_meta = account.get("metadata", {})
-                inner_meta = outer_meta.get("metadata", {})
-                uom = inner_meta.get("uom", "")
-
-                if uom == "Toner":
-                    # Match by color
-                    token_desc = inner_meta.get("tokenDescription", {})
-                    project_data = token_desc.get("projectData", {})
-                    color = project_data.get("Color", "").lower()
-
-                    if color in toner_usage:
-                        usage = toner_usage[color]
-                        account["currentExpenditure"] = usage
-                        toner_matches += 1
-                        job_logger.debug(f"Set {color} toner expenditure: {usage} mL")
-
-                elif uom == "Media":
-                    # Match by mintId
-                    if mint_id == media_mint_id:
-                        account["currentExpenditure"] = sheets_required
-                        media_matches += 1
-                        job_logger.debug(f"Set media expenditure: {sheets_required} sheets")
-
-        job_logger.info(f"Payload built: {toner_matches} toner matches, {media_matches} media matches")
+                account["currentExpenditure"] = usage
+                toner_matches += 1
+
+        for account in media_accounts.get(media_mint_id, ()):
+            account["currentExpenditure"] = sheets_required
+            media_matches += 1
+
+        job_logger.info(
+            "Payload built: %s toner matches, %s media matches",
+            toner_matches, media_matches
+        )
+        if debug_enabled and unmatched_colors:
+            job_logger.debug("No toner account for colors: %s", unmatched_colors)
 
         return template
 
@@ -460,7 +604,8 @@ class JobService:
         job_id: str,
         status: Dict,
         frozen_order: FrozenOrder,
-        job_handle: int
+        job_handle: int,
+        account_details: Optional[Dict[str, Tuple[str, str]]] = None
     ) -> JobResult:
         """
         Parse blockchain status into JobResult.
@@ -470,6 +615,8 @@ class JobService:
             status: Status dict from blockchain
             frozen_order: Original order
             job_handle: DLL job handle
+            account_details: mintId -> (uom, name) from the submitted template.
+                Accounts not found here fall back to their own metadata.
 
         Returns:
             JobResult with parsed data
@@ -480,48 +627,60 @@ class JobService:
         # Check for transaction success - DLL may use "transactionSuccess" or just "final"
         tx_success = status.get("transactionSuccess", status.get("final", False))
         status_str = status.get("status", "unknown")
-        job_logger.debug(f"Parsed: tx_success={tx_success}, status_str={status_str}")
+        job_logger.debug("Parsed: tx_success=%s, status_str=%s", tx_success, status_str)
 
         # Parse ledger entries from results
         # DLL returns nested structure: results = {jobID: ..., results: [{accounts: [...], publicKey: ...}, ...]}
         ledger_entries = []
         results_data = status.get("results", {})
+        if account_details is None:
+            account_details = {}
 
         # Handle both dict (DLL format) and list (legacy format)
         if isinstance(results_data, dict):
             # DLL format: results is a dict with nested 'results' list of wallets
-            wallet_results = results_data.get("results", [])
-            job_logger.debug(f"DLL results format: {len(wallet_results)} wallets")
+            # Normalize once so the loops below only ever see lists
+            wallet_results = results_data.get("results")
+            if not isinstance(wallet_results, list):
+                wallet_results = []
+            # Same transaction ID for every ledger entry - look it up once
+            tx_id = results_data.get("jobID", "")
+            job_logger.debug("DLL results format: %s wallets", len(wallet_results))
 
             for wallet in wallet_results:
                 if not isinstance(wallet, dict):
                     continue
 
-                accounts = wallet.get("accounts", [])
+                accounts = wallet.get("accounts")
+                if not isinstance(accounts, list):
+                    continue
+
                 for account in accounts:
                     if not isinstance(account, dict):
                         continue
 
                     # Extract account info
                     actual_exp = account.get("actualExpenditure", 0.0)
-                    balance = account.get("balance", 0.0)
                     mint_id = account.get("mintId", "")
 
-                    # Get UOM from nested metadata
-                    metadata = account.get("metadata", {})
-                    inner_meta = metadata.get("metadata", {})
-                    uom = inner_meta.get("uom", "")
-                    name = inner_meta.get("name", "")
+                    # Get UOM from the template index, else from nested metadata
+                    details = account_details.get(mint_id) if mint_id else None
+                    if details is not None:
+                        uom, name = details
+                    else:
+                        inner_meta = account.get("metadata", {}).get("metadata", {})
+                        uom = inner_meta.get("uom", "")
+                        name = inner_meta.get("name", "")
 
                     entry = LedgerEntry(
                         account=mint_id or name,
                         amount=actual_exp,
                         unit=uom,
-                        tx_id=results_data.get("jobID", ""),
+                        tx_id=tx_id,
                         success=True
                     )
                     ledger_entries.append(entry)
-                    job_logger.debug(f"Ledger entry: {name} ({uom}): {actual_exp}")
+                    job_logger.debug("Ledger entry: %s (%s): %s", name, uom, actual_exp)
 
         elif isinstance(results_data, list):
             # Legacy format: results is a flat list
@@ -536,7 +695,7 @@ class JobService:
                     )
                     ledger_entries.append(entry)
 
-        job_logger.info(f"Parsed {len(ledger_entries)} ledger entries")
+        job_logger.info("Parsed %s ledger entries", len(ledger_entries))
 
         estimated_cost = frozen_order.estimate.get("estimated_cost", 0.0)
 
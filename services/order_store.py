@@ -0,0 +1,124 @@
+"""
+Server-side order storage.
+
+The in-progress order (analysis, choices, estimate, result) used to live in
+the Flask cookie session, which is serialized, signed and sent to the
+browser on every response. Orders are now kept here in process memory and
+the cookie only carries a short order_id.
+
+Thread Safety:
+    - Uses threading.Lock for all access to the order index
+    - The order dicts themselves belong to one browser session and are only
+      touched by that session's requests
+"""
+
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from logging_config import get_logger
+
+
+# Module logger
+logger = get_logger(__name__)
+
+# Seconds an order may go unused before it is dropped. Abandoned orders
+# (browser closed mid-flow) would otherwise accumulate forever; an order
+# whose job is running is touched by every status poll, so it stays.
+DEFAULT_ORDER_TTL_SECONDS = 3600.0
+
+
+class OrderStore:
+    """
+    Thread-safe storage for in-progress orders, expired after idle time.
+
+    Usage:
+        order_id, order = store.create()
+        order.update({...})          # stored dict is mutated in place
+        order = store.get(order_id)  # None if unknown or expired
+        store.discard(order_id)
+    """
+
+    def __init__(self, ttl_seconds: float = DEFAULT_ORDER_TTL_SECONDS):
+        """
+        Initialize empty order store.
+
+        Args:
+            ttl_seconds: Seconds an order may go unused before it expires
+        """
+        # order_id -> (last access, order), least recently used first
+        self._orders: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+
+    def create(self) -> Tuple[str, Dict[str, Any]]:
+        """
+        Create and store a new, empty order.
+
+        Orders idle for longer than the TTL are dropped first.
+
+        Returns:
+            Tuple of (order_id, order dict)
+        """
+        order_id = secrets.token_urlsafe(16)
+        order: Dict[str, Any] = {}
+        now = time.monotonic()
+
+        with self._lock:
+            self._expire(now)
+            self._orders[order_id] = (now, order)
+
+        return order_id, order
+
+    def get(self, order_id: Optional[str]) -> Optional[Dict[str, Any]]:
+        """
+        Get an order by ID, marking it as used.
+
+        Args:
+            order_id: ID returned by create(), or None
+
+        Returns:
+            Order dict if stored and not expired, None otherwise
+        """
+        if not order_id:
+            return None
+
+        now = time.monotonic()
+        with self._lock:
+            entry = self._orders.get(order_id)
+            if entry is None:
+                return None
+
+            last_access, order = entry
+            if now - last_access > self._ttl_seconds:
+                del self._orders[order_id]
+                return None
+
+            self._orders[order_id] = (now, order)
+            self._orders.move_to_end(order_id)
+            return order
+
+    def discard(self, order_id: Optional[str]) -> None:
+        """
+        Remove an order if it is stored.
+
+        Args:
+            order_id: ID returned by create(), or None
+        """
+        if not order_id:
+            return
+
+        with self._lock:
+            self._orders.pop(order_id, None)
+
+    def _expire(self, now: float) -> None:
+        """Drop orders idle for longer than the TTL (caller holds the lock)."""
+        # Entries are in last-access order, so stop at the first live one
+        while self._orders:
+            order_id, (last_access, _) = next(iter(self._orders.items()))
+            if now - last_access <= self._ttl_seconds:
+                break
+            del self._orders[order_id]
+            logger.debug("Expired order %s", order_id[:8])
@@ -0,0 +1,62 @@
+"""
+Unit tests for core.api_client.ConsumableAPIClient status handling.
+
+These run without the DLL - the client is given a mock library and only
+the status parsing logic is exercised.
+"""
+
+import json
+from unittest.mock import Mock
+
+import pytest
+
+from core import api_client as api_client_module
+from core.api_client import ConsumableAPIClient
+
+
+# Fixtures
+
+@pytest.fixture
+def client():
+    """Client backed by a mock library."""
+    return ConsumableAPIClient(context_handle=1, library=Mock())
+
+
+@pytest.fixture
+def parsers(monkeypatch):
+    """Replace both JSON parsers with mocks that record calls."""
+    json_loads = Mock(side_effect=json.loads)
+    status_parser = Mock(side_effect=api_client_module._status_parser)
+    monkeypatch.setattr(api_client_module, "_json_loads", json_loads)
+    monkeypatch.setattr(api_client_module, "_status_parser", status_parser)
+    return json_loads, status_parser
+
+
+def _status(**fields):
+    return json.dumps(fields).encode("utf-8")
+
+
+class TestParseFinalStatus:
+    """Tests for ConsumableAPIClient._parse_final_status."""
+
+    @pytest.mark.parametrize("raw_status", [
+        _status(status="pending", final=False),
+        _status(status="processing", final=None),
+        b'{"final":0,"status":"processing"}',
+        _status(status="processing"),
+    ])
+    def test_non_final_poll_is_not_parsed(self, client, parsers, raw_status):
+        assert client._parse_final_status(raw_status) is None
+        for parser in parsers:
+            parser.assert_not_called()
+
+    @pytest.mark.parametrize("final", [True, 1, "yes"])
+    def test_truthy_final_is_final(self, client, final):
+        status = client._parse_final_status(_status(status="ready", final=final))
+
+        assert status == {"status": "ready", "final": final}
+
+    def test_nested_final_key_does_not_hide_top_level(self, client):
+        raw_status = _status(final=True, results={"final": False})
+
+        assert client._parse_final_status(raw_status)["final"] is True
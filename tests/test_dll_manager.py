@@ -0,0 +1,27 @@
+"""
+Unit tests for core.dll_manager library loading.
+
+These run without the DLL - the ctypes loader is replaced with a mock.
+"""
+
+from ctypes import CDLL
+from unittest.mock import Mock
+
+from core import dll_manager as dll_manager_module
+
+
+def test_library_is_loaded_as_cdll(monkeypatch):
+    """CDLL releases the GIL during calls; a PyDLL would serialize workers."""
+    assert dll_manager_module.cdll._dlltype is CDLL
+
+    library = Mock()
+    loader = Mock()
+    loader.LoadLibrary.return_value = library
+    monkeypatch.setattr(dll_manager_module, "cdll", loader)
+    dll_manager_module._load_library.cache_clear()
+    try:
+        assert dll_manager_module._load_library("ConsumableClient.dll") is library
+    finally:
+        dll_manager_module._load_library.cache_clear()
+
+    loader.LoadLibrary.assert_called_once_with("ConsumableClient.dll")
@@ -0,0 +1,214 @@
+"""
+Unit tests for the Job Service payload building.
+
+These run without the DLL - the service is given a mock DLLManager and
+only the pure payload logic is exercised.
+"""
+
+import logging
+from unittest.mock import Mock
+
+import pytest
+
+from models.job_result import JobStatus
+from models.order import FrozenOrder
+from services import job_service as job_service_module
+from services.job_service import (
+    JobService,
+    _account_details_by_mint,
+    _index_template_accounts,
+)
+
+
+def _toner_account(mint_id, color):
+    return {
+        "mintId": mint_id,
+        "metadata": {"metadata": {
+            "uom": "Toner",
+            "tokenDescription": {"projectData": {"Color": color}},
+        }},
+    }
+
+
+def _media_account(mint_id):
+    return {"mintId": mint_id, "metadata": {"metadata": {"uom": "Media"}}}
+
+
+# Fixtures
+
+@pytest.fixture
+def template():
+    """Template with two wallets; cyan is held in both."""
+    return {
+        "inventoryParameters": {
+            "wallets": [
+                {"publicKey": "W1", "accounts": [
+                    _toner_account("cyan-1", "Cyan"),
+                    _toner_account("black-1", "BLACK"),
+                    _media_account("paper-a4"),
+                ]},
+                {"publicKey": "W2", "accounts": [
+                    _toner_account("cyan-2", "cyan"),
+                    _media_account("paper-a3"),
+                ]},
+            ]
+        },
+        "jobParameters": {},
+    }
+
+
+@pytest.fixture
+def job_service():
+    """JobService backed by a mock, already-initialized DLLManager."""
+    return JobService(Mock(is_initialized=True))
+
+
+def _order(toner_usage, media_type, sheets):
+    return FrozenOrder(
+        job_name="test",
+        original_filename="a.pdf",
+        stored_filename="a.pdf",
+        stored_path="/tmp/a.pdf",
+        uploaded_at="2024-01-01T00:00:00",
+        pages=1,
+        width_mm=210.0,
+        height_mm=297.0,
+        choices={"media_type": media_type},
+        estimate={"toner_usage": toner_usage, "sheets_required": sheets},
+    )
+
+
+def _accounts(payload):
+    return {
+        account["mintId"]: account
+        for wallet in payload["inventoryParameters"]["wallets"]
+        for account in wallet["accounts"]
+    }
+
+
+class TestWorkerPool:
+    """Tests for JobService's job worker threads."""
+
+    def test_rejects_non_positive_max_workers(self):
+        with pytest.raises(ValueError):
+            JobService(Mock(is_initialized=True), max_workers=0)
+        with pytest.raises(ValueError):
+            JobService(Mock(is_initialized=True), max_workers=-1)
+
+    def test_single_worker_runs_back_to_back_jobs(self, monkeypatch, template):
+        api_client = Mock()
+        api_client.new_job_template.return_value = template
+        api_client.submit_job.return_value = 42
+        api_client.wait_for_job_completion.return_value = {
+            "final": True,
+            "status": "ready",
+            "transactionSuccess": True,
+            "results": {"jobID": "tx-1", "results": []},
+        }
+        monkeypatch.setattr(
+            job_service_module, "ConsumableAPIClient", Mock(return_value=api_client)
+        )
+        service = JobService(Mock(is_initialized=True), max_workers=1)
+
+        job_ids = [service.submit_job(_order({}, "", 0)) for _ in range(2)]
+        assert len(service._workers) == 1
+        service.shutdown()
+
+        for job_id in job_ids:
+            assert not service.is_job_pending(job_id)
+            assert service.get_result(job_id).status is JobStatus.COMPLETED
+
+
+class TestIndexTemplateAccounts:
+    """Tests for _index_template_accounts."""
+
+    def test_groups_toner_by_lowercase_color(self, template):
+        toner, _ = _index_template_accounts(template["inventoryParameters"]["wallets"])
+
+        assert [a["mintId"] for a in toner["cyan"]] == ["cyan-1", "cyan-2"]
+        assert [a["mintId"] for a in toner["black"]] == ["black-1"]
+
+    def test_groups_media_by_mint_id(self, template):
+        _, media = _index_template_accounts(template["inventoryParameters"]["wallets"])
+
+        assert set(media) == {"paper-a4", "paper-a3"}
+
+
+class TestBuildPayload:
+    """Tests for JobService._build_payload."""
+
+    def test_sets_expenditure_on_matching_accounts(self, job_service, template):
+        order = _order({"cyan": 1.5, "black": 2.0}, "paper-a3", 4)
+
+        payload = job_service._build_payload(template, order, logging.getLogger("test"))
+        accounts = _accounts(payload)
+
+        assert accounts["cyan-1"]["currentExpenditure"] == 1.5
+        assert accounts["cyan-2"]["currentExpenditure"] == 1.5
+        assert accounts["black-1"]["currentExpenditure"] == 2.0
+        assert accounts["paper-a3"]["currentExpenditure"] == 4
+        assert "currentExpenditure" not in accounts["paper-a4"]
+
+    def test_unmatched_usage_is_ignored(self, job_service, template):
+        order = _order({"magenta": 3.0}, "missing-media", 1)
+
+        payload = job_service._build_payload(template, order, logging.getLogger("test"))
+
+        assert all(
+            "currentExpenditure" not in account
+            for account in _accounts(payload).values()
+        )
+
+
+class TestParseResult:
+    """Tests for JobService._parse_result."""
+
+    def test_ledger_uses_template_account_details(self, job_service, template):
+        status = {
+            "final": True,
+            "status": "ready",
+            "transactionSuccess": True,
+            "results": {"jobID": "tx-1", "results": [
+                {"accounts": [
+                    {"mintId": "cyan-1", "actualExpenditure": 1.5},
+                    {"mintId": "unknown", "actualExpenditure": 2.0,
+                     "metadata": {"metadata": {"uom": "Media", "name": "Extra"}}},
+                ]},
+            ]},
+        }
+        details = _account_details_by_mint(template)
+
+        result = job_service._parse_result(
+            "job-1", status, _order({}, "", 0), 42, details
+        )
+
+        entries = {e.account: e for e in result.ledger_entries}
+        assert entries["cyan-1"].unit == "Toner"
+        assert entries["cyan-1"].tx_id == "tx-1"
+        assert entries["unknown"].unit == "Media"
+
+    def test_account_without_mint_id_uses_own_metadata(self, job_service, template):
+        template["inventoryParameters"]["wallets"][0]["accounts"].append(
+            {"metadata": {"metadata": {"uom": "Toner", "name": "Unnamed"}}}
+        )
+        status = {
+            "final": True,
+            "status": "ready",
+            "transactionSuccess": True,
+            "results": {"jobID": "tx-1", "results": [
+                {"accounts": [
+                    {"actualExpenditure": 1.0,
+                     "metadata": {"metadata": {"uom": "Media", "name": "Extra"}}},
+                ]},
+            ]},
+        }
+        details = _account_details_by_mint(template)
+
+        result = job_service._parse_result(
+            "job-1", status, _order({}, "", 0), 42, details
+        )
+
+        assert "" not in details
+        [entry] = result.ledger_entries
+        assert entry.account == "Extra"
+        assert entry.unit == "Media"
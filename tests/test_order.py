@@ -0,0 +1,65 @@
+"""
+Unit tests for the Order models.
+
+Covers freezing a stored order for the job thread.
+"""
+
+import pytest
+
+from models.order import Order
+
+
+# Fixtures
+
+@pytest.fixture
+def order_dict():
+    """Order as stored in the OrderStore after /details."""
+    return {
+        "job_name": "Brochure",
+        "original_filename": "brochure.pdf",
+        "stored_filename": "20240101_brochure.pdf",
+        "stored_path": "/tmp/20240101_brochure.pdf",
+        "uploaded_at": "2024-01-01T00:00:00",
+        "analysis": {"pages": 4, "width_mm": 210.0, "height_mm": 297.0},
+        "choices": {
+            "quantity": 10,
+            "color_mode": "full_color",
+            "media_type": "paper-a4",
+            "media_display_name": "A4 Gloss",
+        },
+        "estimate": {
+            "sheets_required": 40,
+            "toner_usage": {"cyan": 1.5, "black": 2.0},
+            "estimated_cost": 12.5,
+        },
+    }
+
+
+class TestFreeze:
+    """Tests for Order.freeze."""
+
+    def test_copies_order_values(self, order_dict):
+        frozen = Order.from_dict(order_dict).freeze()
+
+        assert frozen.quantity == 10
+        assert frozen.media_type == "paper-a4"
+        assert frozen.toner_usage == {"cyan": 1.5, "black": 2.0}
+        assert frozen.sheets_required == 40
+
+    def test_frozen_data_is_detached_from_session(self, order_dict):
+        frozen = Order.from_dict(order_dict).freeze()
+
+        frozen.choices["quantity"] = 99
+        frozen.estimate["toner_usage"]["cyan"] = 0.0
+
+        assert order_dict["choices"]["quantity"] == 10
+        assert order_dict["estimate"]["toner_usage"]["cyan"] == 1.5
+
+    def test_session_changes_do_not_reach_frozen_order(self, order_dict):
+        frozen = Order.from_dict(order_dict).freeze()
+
+        order_dict["choices"]["quantity"] = 1
+        order_dict["estimate"]["toner_usage"]["black"] = 9.0
+
+        assert frozen.quantity == 10
+        assert frozen.toner_usage["black"] == 2.0
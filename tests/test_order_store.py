@@ -0,0 +1,50 @@
+"""
+Unit tests for OrderStore.
+"""
+
+from types import SimpleNamespace
+
+from services import order_store
+from services.order_store import OrderStore
+
+
+def test_create_get_and_discard():
+    """Stored orders are returned by reference until discarded."""
+    store = OrderStore()
+    order_id, order = store.create()
+    order["job_name"] = "Brochure"
+
+    assert store.get(order_id) is order
+    assert store.get(order_id)["job_name"] == "Brochure"
+
+    store.discard(order_id)
+    assert store.get(order_id) is None
+    store.discard(order_id)  # Unknown IDs are ignored
+
+
+def test_missing_order_id():
+    """A session without an order_id has no order."""
+    store = OrderStore()
+    assert store.get(None) is None
+    store.discard(None)
+
+
+def test_idle_orders_expire(monkeypatch):
+    """Orders idle longer than the TTL expire; recently used ones survive."""
+    now = [1000.0]
+    monkeypatch.setattr(order_store, "time", SimpleNamespace(monotonic=lambda: now[0]))
+    store = OrderStore(ttl_seconds=60)
+    first_id, _ = store.create()
+    second_id, _ = store.create()
+
+    now[0] += 45
+    store.get(first_id)  # Touch: first stays live, second keeps aging
+    now[0] += 30
+    third_id, _ = store.create()  # Sweeps the idle second order
+
+    assert second_id not in store._orders
+    assert store.get(first_id) is not None
+    assert store.get(third_id) is not None
+
+    now[0] += 61
+    assert store.get(first_id) is None